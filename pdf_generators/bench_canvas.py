@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the shared HeaderFooterCanvas
+Builds a long synthetic document (200 pages by default) with the brand
+canvas and with the old snapshot-per-page canvas, and reports wall time,
+tracemalloc peak and output size for each.
+
+Usage:
+    python bench_canvas.py
+    python bench_canvas.py --pages 500
+"""
+
+import argparse
+import io
+import time
+import tracemalloc
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, Paragraph, PageBreak
+from reportlab.pdfgen import canvas
+
+from brand import HeaderFooterCanvas, PRIMARY_COLOR, TEXT_SECONDARY
+
+
+class SnapshotCanvas(canvas.Canvas):
+    """The previous implementation: copy the canvas state per page, replay in save()"""
+
+    def __init__(self, *args, **kwargs):
+        canvas.Canvas.__init__(self, *args, **kwargs)
+        self.pages = []
+
+    def showPage(self):
+        self.pages.append(dict(self.__dict__))
+        self._startPage()
+
+    def save(self):
+        page_count = len(self.pages)
+        for page_num, page in enumerate(self.pages, 1):
+            self.__dict__.update(page)
+            self.setFont('Helvetica-Bold', 10)
+            self.setFillColor(PRIMARY_COLOR)
+            self.drawString(0.75 * inch, 10.5 * inch, "The Nursing Collective")
+            self.setFont('Helvetica', 8)
+            self.setFillColor(TEXT_SECONDARY)
+            self.drawCentredString(4.25 * inch, 0.5 * inch,
+                                   f"thenursingcollective.pro | Page {page_num} of {page_count}")
+            canvas.Canvas.showPage(self)
+        canvas.Canvas.save(self)
+
+
+def build(canvasmaker, pages):
+    """Render a document of the given page count into memory; return its size"""
+    styles = getSampleStyleSheet()
+    text = ("Assess airway, breathing and circulation first, then reassess after every intervention. " * 12)
+    elements = []
+    for page in range(pages):
+        elements.append(Paragraph(f"Section {page + 1}", styles['Heading2']))
+        for _ in range(6):
+            elements.append(Paragraph(text, styles['Normal']))
+        elements.append(PageBreak())
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=0.75*inch, leftMargin=0.75*inch,
+                            topMargin=1*inch, bottomMargin=0.75*inch)
+    doc.build(elements, canvasmaker=canvasmaker)
+    return len(buffer.getvalue())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark HeaderFooterCanvas memory on a long document')
+    parser.add_argument('--pages', type=int, default=200, help='pages in the synthetic document (default 200)')
+    args = parser.parse_args()
+
+    print(f"Synthetic document: {args.pages} pages")
+    for name, canvasmaker in (('snapshot', SnapshotCanvas), ('brand', HeaderFooterCanvas)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        size = build(canvasmaker, args.pages)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  {name:<9} {elapsed:6.2f}s   peak {peak / 1024 / 1024:7.1f} MB   output {size / 1024:7.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Shared brand elements for The Nursing Collective PDF generators
+Brand colors, fonts, the paragraph style sheet and the header/footer canvas used by every document
+"""
+
+import os
+from functools import lru_cache
+
+from reportlab.lib.units import inch
+from reportlab.lib import colors
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen import canvas
+
+
+# Brand colors from The Nursing Collective
+PRIMARY_COLOR = colors.HexColor('#2E86AB')  # Medical Blue
+SECONDARY_COLOR = colors.HexColor('#A23B72')  # Healthcare Accent
+ACCENT_COLOR = colors.HexColor('#f59e0b')  # Warm accent
+TEXT_PRIMARY = colors.HexColor('#1f2937')  # Dark gray
+TEXT_SECONDARY = colors.HexColor('#6b7280')  # Medium gray
+
+# Supporting colors for emphasis boxes and tables
+HIGHLIGHT_COLOR = colors.HexColor('#059669')  # Teal/Green for emphasis boxes
+DANGER_COLOR = colors.HexColor('#dc2626')  # Red border
+LIGHT_BLUE = colors.HexColor('#f0f9ff')  # Light blue - calming
+LIGHT_PURPLE = colors.HexColor('#faf5ff')  # Light purple
+LIGHT_TEAL = colors.HexColor('#ecfdf5')  # Light teal
+LIGHT_RED = colors.HexColor('#fef2f2')  # Light red/pink
+LIGHT_AMBER = colors.HexColor('#fef3c7')  # Light amber
+GRID_COLOR = colors.HexColor('#e5e7eb')  # Light gray table grid
+
+# Fonts: the base-14 Helvetica family needs nothing embedded. Optimized
+# renders switch to the site's body font (Source Sans 3) when its TTFs are
+# in fonts/; reportlab embeds only the glyphs a document uses.
+BASE_FONTS = {
+    'regular': 'Helvetica',
+    'bold': 'Helvetica-Bold',
+    'italic': 'Helvetica-Oblique',
+    'boldItalic': 'Helvetica-BoldOblique',
+}
+FONTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fonts')
+BRAND_FONT_FILES = {
+    'regular': 'SourceSans3-Regular.ttf',
+    'bold': 'SourceSans3-Bold.ttf',
+    'italic': 'SourceSans3-Italic.ttf',
+    'boldItalic': 'SourceSans3-BoldItalic.ttf',
+}
+
+
+@lru_cache(maxsize=None)
+def brand_fonts():
+    """Register the brand TTFs from fonts/ and return their names by role
+
+    Returns None when any of the files is missing, so callers fall back to
+    BASE_FONTS.
+    """
+    paths = {role: os.path.join(FONTS_DIR, filename) for role, filename in BRAND_FONT_FILES.items()}
+    if not all(os.path.exists(path) for path in paths.values()):
+        return None
+    names = {}
+    for role, path in paths.items():
+        names[role] = os.path.splitext(os.path.basename(path))[0]
+        pdfmetrics.registerFont(TTFont(names[role], path))
+    # So <b> and <i> inside a paragraph pick the matching brand face
+    pdfmetrics.registerFontFamily(names['regular'], normal=names['regular'], bold=names['bold'],
+                                  italic=names['italic'], boldItalic=names['boldItalic'])
+    return names
+
+
+def get_fonts(use_brand_fonts=False):
+    """Font names by role: the brand TTFs if asked for and available, else Helvetica"""
+    return (use_brand_fonts and brand_fonts()) or BASE_FONTS
+
+
+@lru_cache(maxsize=None)
+def get_stylesheet(use_brand_fonts=False):
+    """Return the brand style sheet, built once per process (and font choice)
+
+    Contains reportlab's sample styles plus every brand ParagraphStyle the
+    generators use, looked up by name (e.g. styles['SectionHeader']).
+    The styles are shared between documents, so treat them as read-only.
+    With use_brand_fonts, every Helvetica face is swapped for its brand
+    counterpart when the brand TTFs are available.
+    """
+    styles = getSampleStyleSheet()
+
+    def add(name, parent, **kwargs):
+        styles.add(ParagraphStyle(name, parent=styles[parent], **kwargs))
+
+    add('CustomTitle', 'Heading1', fontSize=24, textColor=PRIMARY_COLOR, spaceAfter=6,
+        alignment=TA_CENTER, fontName='Helvetica-Bold')
+    add('CustomSubtitle', 'Normal', fontSize=11, textColor=TEXT_SECONDARY, spaceAfter=20,
+        alignment=TA_CENTER, fontName='Helvetica')
+    # Slightly smaller subtitle for the one-page quick references
+    add('CompactSubtitle', 'Normal', fontSize=10, textColor=TEXT_SECONDARY, spaceAfter=20,
+        alignment=TA_CENTER, fontName='Helvetica')
+    add('SectionHeader', 'Heading2', fontSize=14, textColor=PRIMARY_COLOR, spaceAfter=10,
+        spaceBefore=14, fontName='Helvetica-Bold',
+        keepWithNext=True)  # Keep header with next paragraph
+    add('SubsectionHeader', 'Heading3', fontSize=11, textColor=SECONDARY_COLOR, spaceAfter=6,
+        spaceBefore=8, fontName='Helvetica-Bold',
+        keepWithNext=True)  # Keep subsection header with next paragraph
+    add('CategoryHeader', 'Heading3', fontSize=11, textColor=SECONDARY_COLOR, spaceAfter=6,
+        spaceBefore=10, fontName='Helvetica-Bold')
+    add('CustomBody', 'Normal', fontSize=10, textColor=TEXT_PRIMARY, spaceAfter=6,
+        alignment=TA_JUSTIFY, fontName='Helvetica', leading=14)
+    add('BulletStyle', 'Normal', fontSize=10, textColor=TEXT_PRIMARY, spaceAfter=4,
+        leftIndent=20, fontName='Helvetica', leading=13)
+
+    # Compact section headers - alternating colors for visual variety
+    for idx, color in enumerate((PRIMARY_COLOR, SECONDARY_COLOR, HIGHLIGHT_COLOR), 1):
+        add(f'SectionHeader{idx}', 'Heading2', fontSize=12, textColor=color, spaceAfter=8,
+            spaceBefore=12, fontName='Helvetica-Bold')
+
+    # Callouts and notes
+    add('Encouragement', 'Normal', fontSize=10, textColor=TEXT_PRIMARY, alignment=TA_CENTER,
+        fontName='Helvetica-Bold', spaceAfter=6, spaceBefore=6)
+    add('FooterNote', 'Normal', fontSize=8, textColor=TEXT_SECONDARY, alignment=TA_CENTER,
+        fontName='Helvetica-Oblique', spaceAfter=6)
+    add('TipsStyle', 'Normal', fontSize=9, textColor=TEXT_PRIMARY, fontName='Helvetica',
+        leading=12, spaceAfter=4)
+    add('TipsHeaderStyle', 'Normal', fontSize=11, textColor=PRIMARY_COLOR,
+        fontName='Helvetica-Bold', spaceAfter=6)
+
+    fonts = get_fonts(use_brand_fonts)
+    if fonts is not BASE_FONTS:
+        swap = {BASE_FONTS[role]: fonts[role] for role in BASE_FONTS}
+        for name in styles.byName:
+            style = styles[name]
+            for attr in ('fontName', 'bulletFontName'):
+                if getattr(style, attr, None) in swap:
+                    setattr(style, attr, swap[getattr(style, attr)])
+
+    return styles
+
+
+class HeaderFooterCanvas(canvas.Canvas):
+    """Custom canvas for adding headers and footers
+
+    Each page is written out as soon as it is finished instead of being
+    snapshotted until save(). The footer's page total is a single form
+    XObject that every page references and save() defines once the count
+    is known. All Helvetica digits have the same width, so the footer is
+    centred exactly whenever the page number and total have the same
+    number of digits (always, for documents under 10 pages) and within
+    half a digit otherwise.
+    """
+
+    TOTAL_FORM = 'tnc-page-total'
+    HEADER_TEXT = "The Nursing Collective"
+    FONT = BASE_FONTS['regular']
+    FONT_BOLD = BASE_FONTS['bold']
+
+    def __init__(self, *args, **kwargs):
+        canvas.Canvas.__init__(self, *args, **kwargs)
+        self.page_count = 0
+
+    def showPage(self):
+        self.page_count += 1
+        self.draw_header_footer(self.page_count)
+        canvas.Canvas.showPage(self)
+
+    def save(self):
+        if len(self._code):
+            self.showPage()
+        self.beginForm(self.TOTAL_FORM)
+        self.setFont(self.FONT, 8)
+        self.setFillColor(TEXT_SECONDARY)
+        self.drawString(0, 0, str(self.page_count))
+        self.endForm()
+        canvas.Canvas.save(self)
+
+    def draw_header_footer(self, page_num):
+        """Draw header and footer on the current page"""
+        # Header - Brand name
+        self.setFont(self.FONT_BOLD, 10)
+        self.setFillColor(PRIMARY_COLOR)
+        self.drawString(0.75 * inch, 10.5 * inch, self.HEADER_TEXT)
+
+        # Footer - Page number and website; the total is filled in by the form
+        self.setFont(self.FONT, 8)
+        self.setFillColor(TEXT_SECONDARY)
+        footer_text = f"thenursingcollective.pro | Page {page_num} of "
+        total_width = self.stringWidth(str(page_num), self.FONT, 8)
+        x = 4.25 * inch - (self.stringWidth(footer_text, self.FONT, 8) + total_width) / 2
+        self.drawString(x, 0.5 * inch, footer_text)
+        self.saveState()
+        self.translate(x + self.stringWidth(footer_text, self.FONT, 8), 0.5 * inch)
+        self.doForm(self.TOTAL_FORM)
+        self.restoreState()
+
+
+@lru_cache(maxsize=None)
+def canvas_maker(use_brand_fonts=False):
+    """HeaderFooterCanvas, or a subclass drawing the header/footer in the brand fonts"""
+    fonts = get_fonts(use_brand_fonts)
+    if fonts is BASE_FONTS:
+        return HeaderFooterCanvas
+    return type('BrandFontCanvas', (HeaderFooterCanvas,), {'FONT': fonts['regular'], 'FONT_BOLD': fonts['bold']})
@@ -2,67 +2,333 @@
 """
 Main script to generate all free PDF downloads for The Nursing Collective website
 Run this script to regenerate all PDFs at once
+
+Documents are rendered concurrently in a process pool (one worker per core by
+default, -j 1 for one at a time). A failing document does not stop the others;
+the script reports every result and exits non-zero at the end if any failed.
+
+pdf-manifest.json (committed with the PDFs) records, per PDF, a hash of its
+generator source, inputs and reportlab version plus the hash of the file
+written. Documents whose hash still matches are skipped. Renders are invariant
+(no creation date or random document ID), so a document that is rebuilt but
+renders the same bytes as the file on disk is left untouched too: downloads
+keep their bytes and edge caches stay warm on any checkout. --force rebuilds
+everything. Changed outputs are written to a temp file and renamed into place.
+
+--optimize writes the smaller optimized output: binary (not ASCII85) compressed
+streams, plus subsetted brand fonts when they are installed in fonts/. Every
+run reports the size of each document written.
+
+--profile renders one document at a time under cProfile and prints wall time
+per stage (manifest check, flowable build, layout, canvas save, write) and the
+top functions by own time; --profile-dump FILE saves the pstats data too.
 """
 
+import argparse
+import cProfile
+import hashlib
+import inspect
+import json
 import os
+import pstats
 import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import reportlab
 
 # Import the individual PDF generators
 from nclex_priority_concepts import create_nclex_priority_concepts_pdf
 from clinical_day_survival import create_clinical_survival_guide_pdf
 from nursing_supply_list import create_nursing_supply_list_pdf
+from brand import BRAND_FONT_FILES, FONTS_DIR
+import pdf_engine
+from pdf_engine import render_spec, spec_path, stage
+
+
+# Registry of PDFs to generate with their file names.
+# To add a new free resource, add its content spec (or generator) here:
+# entries with a 'spec' are rendered straight from content/ by pdf_engine,
+# entries with a 'function' call it. 'inputs' lists extra files whose
+# changes should trigger a rebuild.
+PDFS = [
+    {
+        'name': 'NCLEX Priority Concepts',
+        'function': create_nclex_priority_concepts_pdf,
+        'inputs': [spec_path('nclex-priority-concepts.yaml')],
+        'filename': 'nclex-priority-concepts.pdf'
+    },
+    {
+        'name': 'First Clinical Day Survival Guide',
+        'function': create_clinical_survival_guide_pdf,
+        'inputs': [spec_path('clinical-day-survival-guide.yaml')],
+        'filename': 'clinical-day-survival-guide.pdf'
+    },
+    {
+        'name': 'Nursing School Supply List',
+        'function': create_nursing_supply_list_pdf,
+        'inputs': [spec_path('nursing-supply-list.yaml')],
+        'filename': 'nursing-supply-list.pdf'
+    }
+]
+
+
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pdf-manifest.json')
+MANIFEST_VERSION = 1
+
+# Modules every generator renders through; a change to any of them rebuilds all PDFs
+SHARED_SOURCES = [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'brand.py'),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pdf_engine.py'),
+]
+
+
+def get_output_dir():
+    """Return ../assets/downloads relative to this script"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(os.path.dirname(script_dir), 'assets', 'downloads')
+
+
+def file_sha256(path):
+    """sha256 of a file's bytes, or None if it does not exist"""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def toolchain_version():
+    # Only the renderer: Python patch releases do not change the bytes reportlab writes
+    return f"reportlab {reportlab.Version}"
+
+
+def build_key(pdf_info, optimize=False):
+    """Hash of everything that determines a PDF: generator source or spec, inputs, toolchain, mode"""
+    sources = list(SHARED_SOURCES)
+    if 'function' in pdf_info:
+        sources.append(inspect.getsourcefile(pdf_info['function']))
+    if 'spec' in pdf_info:
+        sources.append(pdf_info['spec'])
+    sources += pdf_info.get('inputs', [])
+    if optimize:
+        sources += [os.path.join(FONTS_DIR, filename) for filename in BRAND_FONT_FILES.values()]
+    digest = hashlib.sha256(toolchain_version().encode('utf-8'))
+    digest.update(b'optimized' if optimize else b'default')
+    for path in sources:
+        digest.update(os.path.basename(path).encode('utf-8'))
+        digest.update((file_sha256(path) or 'missing').encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    return manifest.get('documents', {})
+
+
+def save_manifest(documents):
+    tmp_path = MANIFEST_PATH + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': MANIFEST_VERSION, 'documents': documents}, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def is_up_to_date(pdf_info, output_dir, manifest, optimize=False):
+    entry = manifest.get(pdf_info['filename'])
+    if not entry or entry.get('key') != build_key(pdf_info, optimize):
+        return False
+    return file_sha256(os.path.join(output_dir, pdf_info['filename'])) == entry.get('sha256')
+
+
+def render_pdf(pdf_info, output_dir, optimize=False):
+    """Render one registered PDF and return its result instead of raising
+
+    The file on disk is only replaced when the rendered bytes differ from it.
+    """
+    output_path = os.path.join(output_dir, pdf_info['filename'])
+    # Write next to the target and rename, so a crash never leaves a half-written PDF
+    tmp_path = os.path.join(output_dir, f".{pdf_info['filename']}.tmp")
+    start = time.perf_counter()
+    try:
+        if 'spec' in pdf_info:
+            data = render_spec(pdf_info['spec'], optimize=optimize)
+        else:
+            data = pdf_info['function'](optimize=optimize)
+        with stage('write'):
+            unchanged = file_sha256(output_path) == hashlib.sha256(data).hexdigest()
+            if not unchanged:
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, output_path)
+    except Exception as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return {
+            'name': pdf_info['name'],
+            'filename': pdf_info['filename'],
+            'ok': False,
+            'seconds': time.perf_counter() - start,
+            'error': f"{type(e).__name__}: {e}",
+            'traceback': traceback.format_exc(),
+        }
+    return {
+        'name': pdf_info['name'],
+        'filename': pdf_info['filename'],
+        'ok': True,
+        'seconds': time.perf_counter() - start,
+        'bytes': len(data),
+        'unchanged': unchanged,
+    }
+
+
+def render_all(pdfs, output_dir, jobs, optimize=False):
+    """Render every PDF, in parallel when jobs > 1; results come back in registry order"""
+    if jobs <= 1 or len(pdfs) <= 1:
+        return [render_pdf(pdf_info, output_dir, optimize) for pdf_info in pdfs]
+
+    results = [None] * len(pdfs)
+    with ProcessPoolExecutor(max_workers=min(jobs, len(pdfs))) as pool:
+        futures = {pool.submit(render_pdf, pdf_info, output_dir, optimize): i for i, pdf_info in enumerate(pdfs)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. pickling or a crashed process)
+                results[i] = {
+                    'name': pdfs[i]['name'],
+                    'filename': pdfs[i]['filename'],
+                    'ok': False,
+                    'seconds': 0.0,
+                    'error': f"{type(e).__name__}: {e}",
+                }
+    return results
+
+
+def print_profile(stage_times, profiler, top, dump=None):
+    total = sum(stage_times.values())
+    print("Stage timings:")
+    for name, seconds in stage_times.items():
+        share = seconds / total * 100 if total else 0.0
+        print(f"  {name:<15} {seconds * 1000:9.2f} ms  {share:5.1f}%")
+    print(f"  {'total':<15} {total * 1000:9.2f} ms")
+
+    stats = pstats.Stats(profiler)
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+    print(f"\nTop {len(rows)} functions by own time:")
+    print(f"  {'own ms':>9} {'cum ms':>9} {'calls':>9}  function")
+    for (filename, line, func), (_, calls, own, cum, _) in rows:
+        where = f"{os.path.basename(filename)}:{line}" if line else filename
+        print(f"  {own * 1000:9.2f} {cum * 1000:9.2f} {calls:9d}  {func} ({where})")
+    if dump:
+        stats.dump_stats(dump)
+        print(f"\n✓ Wrote profile data to {dump} (python -m pstats {dump})")
+    print("="*60 + "\n")
 
 
 def main():
     """Generate all free PDF resources"""
 
+    parser = argparse.ArgumentParser(description='Generate all free PDF downloads')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='number of worker processes (default: one per CPU core; 1 = sequential)')
+    parser.add_argument('--force', action='store_true',
+                        help='rebuild every PDF even if its manifest hash is unchanged')
+    parser.add_argument('--optimize', action='store_true',
+                        help='write smaller PDFs: binary compressed streams, subsetted brand fonts if installed')
+    parser.add_argument('--profile', action='store_true',
+                        help='print per-stage timings and the hottest functions (renders sequentially under cProfile)')
+    parser.add_argument('--profile-dump', metavar='FILE',
+                        help='save the pstats data to FILE (implies --profile)')
+    parser.add_argument('--profile-top', type=int, default=15, metavar='N',
+                        help='functions to list with --profile (default 15)')
+    args = parser.parse_args()
+
+    profiler = None
+    if args.profile or args.profile_dump:
+        # Workers would hide the render from the profiler, so stay in-process
+        args.jobs = 1
+        pdf_engine.stage_times = {}
+        profiler = cProfile.Profile()
+        profiler.enable()
+
     print("\n" + "="*60)
     print("Generating Free PDF Resources for The Nursing Collective")
     print("="*60 + "\n")
 
     # Get the output directory
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    output_dir = os.path.join(os.path.dirname(script_dir), 'assets', 'downloads')
+    output_dir = get_output_dir()
 
     # Ensure output directory exists
     os.makedirs(output_dir, exist_ok=True)
 
-    # List of PDFs to generate with their file names
-    pdfs = [
-        {
-            'name': 'NCLEX Priority Concepts',
-            'function': create_nclex_priority_concepts_pdf,
-            'filename': 'nclex-priority-concepts.pdf'
-        },
-        {
-            'name': 'First Clinical Day Survival Guide',
-            'function': create_clinical_survival_guide_pdf,
-            'filename': 'clinical-day-survival-guide.pdf'
-        },
-        {
-            'name': 'Nursing School Supply List',
-            'function': create_nursing_supply_list_pdf,
-            'filename': 'nursing-supply-list.pdf'
-        }
-    ]
-
-    # Generate each PDF
-    success_count = 0
-    for pdf_info in pdfs:
-        try:
-            print(f"Generating {pdf_info['name']}...")
-            output_path = os.path.join(output_dir, pdf_info['filename'])
-            pdf_info['function'](output_path)
-            success_count += 1
-        except Exception as e:
-            print(f"✗ Error generating {pdf_info['name']}: {str(e)}")
-            sys.exit(1)
+    with stage('manifest check'):
+        manifest = {} if args.force else load_manifest()
+        stale = [pdf_info for pdf_info in PDFS if not is_up_to_date(pdf_info, output_dir, manifest, args.optimize)]
+
+    start = time.perf_counter()
+    rendered = {result['filename']: result for result in render_all(stale, output_dir, args.jobs, args.optimize)}
+    elapsed = time.perf_counter() - start
+
+    results = []
+    for pdf_info in PDFS:
+        result = rendered.get(pdf_info['filename'])
+        if result is None:
+            result = {'name': pdf_info['name'], 'filename': pdf_info['filename'], 'ok': True,
+                      'skipped': True, 'seconds': 0.0}
+        elif result['ok']:
+            manifest[pdf_info['filename']] = {
+                'key': build_key(pdf_info, args.optimize),
+                'sha256': file_sha256(os.path.join(output_dir, pdf_info['filename'])),
+                'toolchain': toolchain_version(),
+            }
+        results.append(result)
+    if rendered:
+        # Keep entries for registered PDFs only
+        with stage('manifest save'):
+            save_manifest({pdf_info['filename']: manifest[pdf_info['filename']]
+                           for pdf_info in PDFS if pdf_info['filename'] in manifest})
+
+    print()
+    for result in results:
+        if result.get('skipped'):
+            print(f"= {result['name']:<36}    skip  {'':>9}  {result['filename']} (unchanged)")
+        elif result['ok']:
+            print(f"✓ {result['name']:<36} {result['seconds']:6.2f}s  {result['bytes'] / 1024:6.1f} KB  "
+                  f"{result['filename']}{' (same bytes, not rewritten)' if result['unchanged'] else ''}")
+        else:
+            print(f"✗ {result['name']:<36} {result['seconds']:6.2f}s  {result['error']}")
+            if result.get('traceback'):
+                print(result['traceback'])
+
+    success_count = sum(1 for result in results if result['ok'])
 
     print("\n" + "="*60)
-    print(f"✓ Successfully generated {success_count}/{len(pdfs)} PDFs")
+    unchanged_count = sum(1 for result in results if result.get('skipped') or result.get('unchanged'))
+    print(f"{'✓' if success_count == len(results) else '✗'} {success_count}/{len(results)} PDFs OK "
+          f"({success_count - unchanged_count} written, {unchanged_count} unchanged) in {elapsed:.2f}s")
+    written = [result['bytes'] for result in results if result.get('bytes') and not result['unchanged']]
+    if written:
+        print(f"✓ {sum(written) / 1024:.1f} KB written, {sum(written) / len(written) / 1024:.1f} KB per document"
+              f"{' (optimized)' if args.optimize else ''}")
     print(f"✓ Output directory: {output_dir}")
     print("="*60 + "\n")
 
+    if profiler is not None:
+        profiler.disable()
+        print_profile(pdf_engine.stage_times, profiler, args.profile_top, args.profile_dump)
+
+    if success_count != len(results):
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Data-driven rendering engine for The Nursing Collective PDF downloads
+Turns a declarative document spec (YAML or JSON in content/) into a branded PDF
+
+A spec is a title, an optional subtitle and a list of blocks:
+
+    title: First Clinical Day Survival Guide
+    subtitle: Essential Tips for Nervous Nursing Students
+    blocks:
+      - {type: paragraph, text: "Your first clinical day..."}
+      - {type: spacer, height: 0.15}                  # inches
+      - {type: heading, text: The Night Before}        # style defaults to SectionHeader
+      - type: bullets                                  # strings get a bullet,
+        items:                                         # {label, text} a bold label
+          - {label: Pack Your Clinical Bag, text: "Stethoscope, pen light..."}
+          - Eat a substantial breakfast with protein.
+      - type: box                                      # colored callout box
+        background: LIGHT_TEAL
+        border: HIGHLIGHT_COLOR
+        header: "<b>Do's:</b>"
+        items: [...]
+      - {type: grid, columns: 3, col_width: 2.3, background: LIGHT_BLUE, items: [...]}
+      - {type: item_table, items: [{label: Stethoscope, text: ...}]}
+      - {type: columns, columns: 2, items: [...]}
+      - {type: keep_together, blocks: [...]}
+
+Colors are brand.py constant names and styles are names in
+brand.get_stylesheet(). Specs are validated and compiled once per process
+(and again only when the file changes); each render then just instantiates
+fresh flowables from the compiled plan. Table styles are shared between
+every block and document that uses the same settings.
+"""
+
+import io
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+
+from reportlab import rl_config
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, KeepTogether
+
+import brand
+from brand import canvas_maker, get_fonts, get_stylesheet
+
+try:
+    import yaml
+except ImportError:  # JSON specs still work without PyYAML
+    yaml = None
+
+
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'content')
+
+PAGE_MARGINS = {
+    'rightMargin': 0.75*inch,
+    'leftMargin': 0.75*inch,
+    'topMargin': 1*inch,
+    'bottomMargin': 0.75*inch,
+}
+
+# Invariant documents carry a fixed creation date and a document ID derived
+# from their content, so rendering unchanged content gives identical bytes
+DOC_OPTIONS = dict(PAGE_MARGINS, pagesize=letter, invariant=1)
+
+
+def spec_path(name):
+    """Path of a spec in content/ by file name (e.g. 'nursing-supply-list.yaml')"""
+    return os.path.join(CONTENT_DIR, name)
+
+
+# ── Spec loading ──
+
+_compiled = {}
+
+
+def read_spec(path):
+    """Parse a YAML or JSON spec file into a dict"""
+    with open(path, encoding='utf-8') as f:
+        if path.endswith('.json'):
+            return json.load(f)
+        if yaml is None:
+            raise RuntimeError(f"{path}: PyYAML is required for YAML specs (pip install pyyaml)")
+        return yaml.safe_load(f)
+
+
+def load_spec(path, use_brand_fonts=False):
+    """Return the compiled plan for a spec file, reusing it while the file is unchanged"""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = (path, use_brand_fonts)
+    cached = _compiled.get(key)
+    if cached is None or cached[0] != stamp:
+        plan = compile_spec(read_spec(path), os.path.basename(path), use_brand_fonts)
+        cached = _compiled[key] = (stamp, plan)
+    return cached[1]
+
+
+# ── Compilation ──
+
+def color(name, where):
+    value = getattr(brand, name, None) if isinstance(name, str) and name.isupper() else None
+    if value is None:
+        raise ValueError(f"{where}: unknown brand color {name!r}")
+    return value
+
+
+def style(name, where, use_brand_fonts):
+    styles = get_stylesheet(use_brand_fonts)
+    if name not in styles:
+        raise ValueError(f"{where}: unknown paragraph style {name!r}")
+    return styles[name]
+
+
+def item_text(item, where):
+    """Bulleted markup for a plain string, bold-label markup for {label, text}"""
+    if isinstance(item, str):
+        return f"• {item}"
+    if isinstance(item, dict) and set(item) == {'label', 'text'}:
+        return f"<b>{item['label']}:</b> {item['text']}"
+    raise ValueError(f"{where}: items must be strings or {{label, text}} mappings")
+
+
+@lru_cache(maxsize=None)
+def box_style(background, border, border_width, padding_y, padding_x, valign):
+    commands = [
+        ('BACKGROUND', (0, 0), (-1, -1), color(background, 'box')),
+        ('BOX', (0, 0), (-1, -1), border_width, color(border, 'box')),
+        ('TOPPADDING', (0, 0), (-1, -1), padding_y),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), padding_y),
+        ('LEFTPADDING', (0, 0), (-1, -1), padding_x),
+        ('RIGHTPADDING', (0, 0), (-1, -1), padding_x),
+    ]
+    if valign:
+        commands.append(('VALIGN', (0, 0), (-1, -1), valign))
+    return TableStyle(commands)
+
+
+@lru_cache(maxsize=None)
+def grid_style(background, font):
+    return TableStyle([
+        ('FONT', (0, 0), (-1, -1), font, 9),
+        ('TEXTCOLOR', (0, 0), (-1, -1), brand.TEXT_PRIMARY),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 6),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+        ('TOPPADDING', (0, 0), (-1, -1), 4),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ('GRID', (0, 0), (-1, -1), 0.5, brand.GRID_COLOR),
+        ('BACKGROUND', (0, 0), (-1, -1), color(background, 'grid')),
+    ])
+
+
+@lru_cache(maxsize=None)
+def item_table_style(label_background):
+    return TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 8),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 0.5, brand.GRID_COLOR),
+        ('BACKGROUND', (0, 0), (0, -1), color(label_background, 'item_table')),
+    ])
+
+
+@lru_cache(maxsize=None)
+def columns_style():
+    return TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 8),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 4),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ])
+
+
+def rows_of(items, columns, pad):
+    return [list(items[i:i + columns]) + [pad] * (columns - len(items[i:i + columns]))
+            for i in range(0, len(items), columns)]
+
+
+# Each compiler checks one block and returns a function that builds its flowables.
+# Everything that can be resolved up front (styles, colors, markup, table styles)
+# is resolved here, so the returned builders do no lookups at render time.
+
+def compile_paragraph(block, where, use_brand_fonts):
+    text, para_style = block['text'], style(block.get('style', 'CustomBody'), where, use_brand_fonts)
+    return lambda: [Paragraph(text, para_style)]
+
+
+def compile_heading(block, where, use_brand_fonts):
+    text, para_style = block['text'], style(block.get('style', 'SectionHeader'), where, use_brand_fonts)
+    return lambda: [Paragraph(text, para_style)]
+
+
+def compile_spacer(block, where, use_brand_fonts):
+    height = block['height']*inch
+    return lambda: [Spacer(1, height)]
+
+
+def compile_bullets(block, where, use_brand_fonts):
+    texts = [item_text(item, where) for item in block['items']]
+    para_style = style(block.get('style', 'BulletStyle'), where, use_brand_fonts)
+    return lambda: [Paragraph(text, para_style) for text in texts]
+
+
+def compile_box(block, where, use_brand_fonts):
+    texts = [item_text(item, where) for item in block.get('items', [])]
+    if 'text' in block:
+        texts.append(block['text'])
+    para_style = style(block.get('style', 'BulletStyle'), where, use_brand_fonts)
+    header = block.get('header')
+    header_style = style(block.get('header_style', 'SubsectionHeader'), where, use_brand_fonts) if header else None
+    padding_y, padding_x = block.get('padding', [6, 12])
+    color(block['background'], where)
+    color(block['border'], where)
+    table_style = box_style(block['background'], block['border'], block.get('border_width', 1.5),
+                            padding_y, padding_x, block.get('valign'))
+    width = block.get('width', 6.5)*inch
+    repeat_rows = 1 if header and block.get('repeat_header') else 0
+
+    def build():
+        rows = [[Paragraph(header, header_style)]] if header else []
+        rows += [[Paragraph(text, para_style)] for text in texts]
+        table = Table(rows, colWidths=[width], repeatRows=repeat_rows)
+        table.setStyle(table_style)
+        return [table]
+    return build
+
+
+def compile_grid(block, where, use_brand_fonts):
+    columns = block.get('columns', 3)
+    rows = rows_of(block['items'], columns, '')
+    widths = [block.get('col_width', 2.3)*inch] * columns
+    color(block['background'], where)
+    table_style = grid_style(block['background'], get_fonts(use_brand_fonts)['regular'])
+
+    def build():
+        table = Table([list(row) for row in rows], colWidths=widths)
+        table.setStyle(table_style)
+        return [table]
+    return build
+
+
+def compile_item_table(block, where, use_brand_fonts):
+    items = [(f"<b>{item['label']}</b>", item['text']) for item in block['items']]
+    para_style = style(block.get('style', 'CustomBody'), where, use_brand_fonts)
+    widths = [w*inch for w in block.get('col_widths', [1.8, 4.7])]
+    label_background = block.get('label_background', 'LIGHT_BLUE')
+    color(label_background, where)
+    table_style = item_table_style(label_background)
+
+    def build():
+        table = Table([[Paragraph(label, para_style), Paragraph(text, para_style)] for label, text in items],
+                      colWidths=widths)
+        table.setStyle(table_style)
+        return [table]
+    return build
+
+
+def compile_columns(block, where, use_brand_fonts):
+    columns = block.get('columns', 2)
+    rows = rows_of([item_text(item, where) for item in block['items']], columns, '')
+    para_style = style(block.get('style', 'CustomBody'), where, use_brand_fonts)
+    width = block.get('width', 6.5)*inch / columns
+
+    def build():
+        table = Table([[Paragraph(text, para_style) for text in row] for row in rows],
+                      colWidths=[width] * columns)
+        table.setStyle(columns_style())
+        return [table]
+    return build
+
+
+def compile_keep_together(block, where, use_brand_fonts):
+    builders = compile_blocks(block['blocks'], where, use_brand_fonts)
+    return lambda: [KeepTogether(build_flowables(builders))]
+
+
+BLOCKS = {
+    'paragraph': (compile_paragraph, {'text'}),
+    'heading': (compile_heading, {'text'}),
+    'spacer': (compile_spacer, {'height'}),
+    'bullets': (compile_bullets, {'items'}),
+    'box': (compile_box, {'background', 'border'}),
+    'grid': (compile_grid, {'items', 'background'}),
+    'item_table': (compile_item_table, {'items'}),
+    'columns': (compile_columns, {'items'}),
+    'keep_together': (compile_keep_together, {'blocks'}),
+}
+
+
+def compile_blocks(blocks, where, use_brand_fonts=False):
+    if not isinstance(blocks, list):
+        raise ValueError(f"{where}: 'blocks' must be a list")
+    builders = []
+    for i, block in enumerate(blocks):
+        block_where = f"{where}[{i}]"
+        kind = block.get('type') if isinstance(block, dict) else None
+        if kind not in BLOCKS:
+            raise ValueError(f"{block_where}: unknown block type {kind!r} (expected one of {', '.join(BLOCKS)})")
+        compiler, required = BLOCKS[kind]
+        missing = required - set(block)
+        if missing:
+            raise ValueError(f"{block_where}: {kind} block is missing {', '.join(sorted(missing))}")
+        builders.append(compiler(block, f"{block_where} ({kind})", use_brand_fonts))
+    return builders
+
+
+def build_flowables(builders):
+    flowables = []
+    for build in builders:
+        flowables.extend(build())
+    return flowables
+
+
+def compile_spec(spec, source='spec', use_brand_fonts=False):
+    """Validate a parsed spec and compile it into a list of flowable builders"""
+    if not isinstance(spec, dict) or 'title' not in spec:
+        raise ValueError(f"{source}: a spec needs at least a 'title'")
+    header = [{'type': 'paragraph', 'text': spec['title'], 'style': 'CustomTitle'}]
+    if spec.get('subtitle'):
+        header.append({'type': 'paragraph', 'text': spec['subtitle'],
+                       'style': spec.get('subtitle_style', 'CustomSubtitle')})
+    return compile_blocks(header + spec.get('blocks', []), f"{source}:blocks", use_brand_fonts)
+
+
+# ── Rendering ──
+
+# Wall time per render stage, accumulated across renders while profiling
+# (generate_free_pdfs.py --profile sets this to a dict); None when off
+stage_times = None
+_open_stages = []  # time spent in stages nested inside each open stage
+
+
+@contextmanager
+def stage(name):
+    """Time a stage; a stage nested in another is not counted in the outer one"""
+    if stage_times is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    _open_stages.append(0.0)
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - t0
+        nested = _open_stages.pop()
+        stage_times[name] = stage_times.get(name, 0.0) + elapsed - nested
+        if _open_stages:
+            _open_stages[-1] += elapsed
+
+
+def build_elements(spec, use_brand_fonts=False):
+    """Fresh flowables for a spec file path or an already-parsed spec dict"""
+    if isinstance(spec, str):
+        builders = load_spec(spec, use_brand_fonts)
+    else:
+        builders = compile_spec(spec, use_brand_fonts=use_brand_fonts)
+    return build_flowables(builders)
+
+
+def write_output(data, output):
+    """Write finished PDF bytes to a path or writable binary stream and return the size
+
+    With output=None nothing is written and the bytes themselves are returned.
+    """
+    if output is None:
+        return data
+    if hasattr(output, 'write'):
+        output.write(data)
+    else:
+        with open(output, 'wb') as f:
+            f.write(data)
+    return len(data)
+
+
+# reportlab reads useA85 from its process-wide config while a document is
+# written and has no per-document switch, so every save sets it under a lock
+# and puts the default back; compression itself is passed per document
+_encoding_lock = threading.Lock()
+DEFAULT_A85 = rl_config.useA85
+
+
+@contextmanager
+def stream_encoding(optimize):
+    """Hold the stream encoding for one document save
+
+    Optimized output keeps Flate compression but drops the ASCII85 wrapper
+    reportlab puts around every stream by default, which costs 25% of each
+    compressed stream to keep the file 7-bit clean.
+    """
+    with _encoding_lock:
+        rl_config.useA85 = 0 if optimize else DEFAULT_A85
+        try:
+            yield
+        finally:
+            rl_config.useA85 = DEFAULT_A85
+
+
+def doc_options(optimize=False):
+    """SimpleDocTemplate arguments for a brand document"""
+    return dict(DOC_OPTIONS, pageCompression=1) if optimize else DOC_OPTIONS
+
+
+@lru_cache(maxsize=None)
+def document_canvas(optimize=False):
+    """The brand canvas for a render, saving under the matching stream encoding"""
+    base = canvas_maker(optimize)
+
+    def save(self):
+        with stage('canvas save'), stream_encoding(optimize):
+            base.save(self)
+    return type(base.__name__, (base,), {'save': save})
+
+
+def render_spec(spec, output=None, optimize=False):
+    """Render a spec (file path or dict) with the brand page template
+
+    output may be a file path or any writable binary stream (BytesIO, a
+    socket file, a response body); the size in bytes is returned. Without
+    an output the PDF bytes are returned, so nothing touches the disk.
+
+    optimize writes binary compressed streams and embeds subsets of the
+    brand fonts when they are installed in fonts/ (see brand.brand_fonts).
+    """
+    buffer = io.BytesIO()
+    with stage('flowables'):
+        elements = build_elements(spec, optimize)
+    doc = SimpleDocTemplate(buffer, **doc_options(optimize))
+    with stage('layout'):
+        doc.build(elements, canvasmaker=document_canvas(optimize))
+    with stage('write'):
+        return write_output(buffer.getvalue(), output)
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Batch generator for personalized copies of the free PDF downloads
+Lays a content spec out once, then stamps each student's name, school and
+exam date into the page header of a fresh copy of the finished pages
+
+Platypus layout (wrapping, splitting, page breaking) is the expensive part of
+a render and is identical for every student, so it runs once: RecordingCanvas
+keeps each laid-out page's drawing operators. Every personalized copy replays
+those operators on a new HeaderFooterCanvas, adds the stamp and writes the
+PDF - no flowables are rebuilt. With no stamp the replay is byte-identical to
+a normal render (both are invariant documents).
+
+Usage:
+    python personalize.py nclex-priority-concepts --people students.csv --out personalized/
+    python personalize.py nclex-priority-concepts --people students.csv --out personalized.zip
+    python personalize.py clinical-day-survival-guide --synthetic 1000 --out /tmp/batch.zip
+
+students.csv needs a header row with name, school and exam_date columns;
+an optional id column names each file (otherwise the row number is used).
+The stamp is set in base-14 Helvetica, which only has the WinAnsi
+(Windows-1252) characters: rows with other characters are skipped and
+listed, and stamps too long for the header are cut with an ellipsis.
+
+Replaying pages reaches into reportlab internals (the canvas's operator
+list and resource bookkeeping); check_reportlab() fails loudly when an
+upgrade has removed any of them. Tested with reportlab 5.0.
+"""
+
+import argparse
+import csv
+import io
+import os
+import re
+import sys
+import time
+import zipfile
+
+import reportlab
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+from reportlab.platypus import SimpleDocTemplate
+
+from brand import HeaderFooterCanvas, TEXT_SECONDARY
+from pdf_engine import DOC_OPTIONS, build_elements, spec_path, stream_encoding, write_output
+
+
+FIELDS = ('name', 'school', 'exam_date')
+
+STAMP_FONT = 'Helvetica'
+STAMP_SIZE = 8
+STAMP_RIGHT = 7.75 * inch
+# The stamp ends at the right margin and stays this far clear of the brand name
+STAMP_LEFT = 0.75 * inch + stringWidth(HeaderFooterCanvas.HEADER_TEXT, HeaderFooterCanvas.FONT_BOLD, 10) + 0.25 * inch
+STAMP_ENCODING = 'cp1252'  # WinAnsiEncoding, what base-14 fonts can show
+
+# reportlab internals the recording and replay rely on
+CANVAS_INTERNALS = ('_code', '_colorsUsed', '_formsinuse', '_annotationrefs', '_shadingUsed', '_extgstate',
+                    '_startPage', '_doc')
+
+
+def check_reportlab(canv):
+    """Raise RuntimeError if this reportlab lacks an internal that replaying pages needs"""
+    missing = [name for name in CANVAS_INTERNALS if not hasattr(canv, name)]
+    if not hasattr(getattr(canv, '_doc', None), 'fontMapping'):
+        missing.append('_doc.fontMapping')
+    if not hasattr(SimpleDocTemplate, '_makeCanvas'):
+        missing.append('BaseDocTemplate._makeCanvas')
+    if missing:
+        raise RuntimeError(f"personalize.py does not support reportlab {reportlab.Version}: "
+                           f"missing {', '.join(missing)} (tested with reportlab 5.0)")
+
+
+def check_stamp(text):
+    """Raise ValueError if the stamp has characters base-14 Helvetica cannot show"""
+    bad = sorted({ch for ch in text if not ch.encode(STAMP_ENCODING, 'ignore')})
+    if bad:
+        raise ValueError(f"stamp has characters the PDF font cannot show: {''.join(bad)}")
+
+
+def fit_stamp(text):
+    """The stamp, cut with an ellipsis if it would run into the brand name"""
+    room = STAMP_RIGHT - STAMP_LEFT
+    if stringWidth(text, STAMP_FONT, STAMP_SIZE) <= room:
+        return text
+    while text and stringWidth(text + '…', STAMP_FONT, STAMP_SIZE) > room:
+        text = text[:-1]
+    return text.rstrip(' ·') + '…'
+
+
+class RecordingCanvas(canvas.Canvas):
+    """Canvas that keeps each page's drawing operators instead of writing a PDF
+
+    Only plain text and vector drawing can be replayed: pages that use forms,
+    links, transparency or shadings reference objects owned by this canvas's
+    document, so they are rejected rather than silently broken.
+    """
+
+    def __init__(self, *args, **kwargs):
+        canvas.Canvas.__init__(self, *args, **kwargs)
+        check_reportlab(self)
+        self.pages = []
+        self._fonts_seen = len(self._doc.fontMapping)
+
+    def showPage(self):
+        if self._formsinuse or self._annotationrefs or self._shadingUsed or self._extgstate.getState():
+            raise ValueError("personalized layouts support text and vector drawing only "
+                             "(no forms, links, transparency or shadings)")
+        # Fonts first used on this page, in registration order
+        fonts = list(self._doc.fontMapping)[self._fonts_seen:]
+        self._fonts_seen += len(fonts)
+        self.pages.append((list(self._code), dict(self._colorsUsed), fonts))
+        self._startPage()
+
+    def save(self):
+        if len(self._code):
+            self.showPage()
+
+
+class StampCanvas(HeaderFooterCanvas):
+    """HeaderFooterCanvas that writes recorded pages plus a personal header stamp"""
+
+    def __init__(self, *args, **kwargs):
+        self.stamp = kwargs.pop('stamp', None)
+        HeaderFooterCanvas.__init__(self, *args, **kwargs)
+
+    def replay(self, layout):
+        for code, colors_used, fonts in layout.pages:
+            # Register fonts at the point the recording did, so the operators'
+            # /F1, /F2... names resolve to the same fonts in this document
+            for font in fonts:
+                self._doc.getInternalFontName(font)
+            self._code.extend(code)
+            self._colorsUsed.update(colors_used)
+            if self.stamp:
+                self.draw_stamp(self.stamp)
+            self.showPage()
+        with stream_encoding(False):
+            self.save()
+
+    def draw_stamp(self, text):
+        """Right-aligned in the header, opposite the brand name"""
+        self.saveState()
+        self.setFont(STAMP_FONT, STAMP_SIZE)
+        self.setFillColor(TEXT_SECONDARY)
+        self.drawRightString(STAMP_RIGHT, 10.5 * inch, fit_stamp(text))
+        self.restoreState()
+
+
+class Layout:
+    """A content spec laid out once, ready to be stamped and written many times"""
+
+    def __init__(self, spec):
+        self.doc = SimpleDocTemplate(io.BytesIO(), **DOC_OPTIONS)
+        self.doc.build(build_elements(spec), canvasmaker=RecordingCanvas)
+        self.pages = self.doc.canv.pages
+
+    def render(self, output=None, stamp=None):
+        """Write one copy with the given header stamp, like pdf_engine.render_spec
+
+        Returns the size written to a path or binary stream, or the bytes
+        themselves when output is None. Raises ValueError for a stamp the
+        header font cannot show (see check_stamp).
+        """
+        if stamp:
+            check_stamp(stamp)
+        buffer = io.BytesIO()
+        canv = self.doc._makeCanvas(buffer, canvasmaker=lambda *a, **kw: StampCanvas(*a, stamp=stamp, **kw))
+        canv.replay(self)
+        return write_output(buffer.getvalue(), output)
+
+
+def stamp_text(person):
+    """'Prepared for Jane Doe · State University · Exam 2027-05-01' from the fields present"""
+    parts = []
+    if person.get('name'):
+        parts.append(f"Prepared for {person['name']}")
+    if person.get('school'):
+        parts.append(person['school'])
+    if person.get('exam_date'):
+        parts.append(f"Exam {person['exam_date']}")
+    return ' · '.join(parts)
+
+
+def safe_filename(text):
+    return re.sub(r'[^A-Za-z0-9._-]+', '-', text).strip('-') or 'student'
+
+
+def generate_batch(spec, people, out, prefix):
+    """Render one personalized copy per person into a directory or a .zip
+
+    People whose stamp cannot be rendered are skipped. Returns (documents
+    written, total bytes, seconds spent rendering, [(row, reason)] skipped).
+    """
+    start = time.perf_counter()
+    layout = Layout(spec)
+    count = total = 0
+    skipped = []
+    to_zip = out.endswith('.zip')
+    if to_zip:
+        archive = zipfile.ZipFile(out, 'w', zipfile.ZIP_STORED)  # PDF streams are already compressed
+    else:
+        os.makedirs(out, exist_ok=True)
+    try:
+        for i, person in enumerate(people, 1):
+            filename = f"{prefix}-{safe_filename(person.get('id') or str(i))}.pdf"
+            try:
+                data = layout.render(stamp=stamp_text(person))
+            except ValueError as e:
+                skipped.append((person.get('id') or str(i), str(e)))
+                continue
+            if to_zip:
+                archive.writestr(filename, data)
+            else:
+                with open(os.path.join(out, filename), 'wb') as f:
+                    f.write(data)
+            count += 1
+            total += len(data)
+    finally:
+        if to_zip:
+            archive.close()
+    return count, total, time.perf_counter() - start, skipped
+
+
+def read_people(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        missing = [field for field in FIELDS if field not in (reader.fieldnames or [])]
+        if missing:
+            sys.exit(f"{path}: missing column(s) {', '.join(missing)}")
+        return list(reader)
+
+
+def synthetic_people(count):
+    return [{'id': f"{i:06d}", 'name': f"Student {i}", 'school': "State University School of Nursing",
+             'exam_date': f"2027-{i % 12 + 1:02d}-15"} for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate personalized copies of a free PDF')
+    parser.add_argument('spec', help="content spec name in content/ (e.g. nclex-priority-concepts)")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--people', help='CSV with name, school, exam_date (and optional id) columns')
+    source.add_argument('--synthetic', type=int, metavar='N', help='generate N synthetic students (for benchmarking)')
+    parser.add_argument('--out', required=True, help='output directory, or a path ending in .zip')
+    args = parser.parse_args()
+
+    name = args.spec[:-5] if args.spec.endswith('.yaml') else args.spec
+    spec = spec_path(f"{name}.yaml")
+    if not os.path.exists(spec):
+        sys.exit(f"No content spec at {spec}")
+    people = read_people(args.people) if args.people else synthetic_people(args.synthetic)
+
+    count, total, elapsed, skipped = generate_batch(spec, people, args.out, name)
+    for row, reason in skipped:
+        print(f"✗ skipped {row}: {reason}", file=sys.stderr)
+    rate = count / elapsed if elapsed else 0.0
+    print(f"✓ {count} personalized PDFs ({total / 1024 / 1024:.1f} MB) in {elapsed:.2f}s "
+          f"- {rate:.0f} docs/sec -> {args.out}")
+    if skipped:
+        sys.exit(f"✗ {len(skipped)} row(s) skipped")
+
+
+if __name__ == "__main__":
+    main()
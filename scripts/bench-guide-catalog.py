@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark build-guide-catalog.py on a synthetic CLASS_CATALOG.
+
+Generates a my-guides-script.js-shaped source with N guides (default
+10,000) spread over classes and topics, then times extract_classes()
+and build_catalog() on it. Nothing is written to the repo.
+
+Usage:
+    python3 scripts/bench-guide-catalog.py
+    python3 scripts/bench-guide-catalog.py --guides 50000 --repeat 5
+
+Parse time should scale linearly with guide count; compare the
+per-guide figure across sizes to spot a quadratic regression.
+"""
+
+import argparse
+import importlib.util
+import statistics
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+
+
+def load_builder():
+    """Import build-guide-catalog.py (hyphenated, so not importable by name)."""
+    spec = importlib.util.spec_from_file_location('build_guide_catalog', HERE / 'build-guide-catalog.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_source(guide_count, classes=6, topics_per_class=10):
+    """Return JS source with a CLASS_CATALOG holding guide_count guides."""
+    per_topic = max(1, guide_count // (classes * topics_per_class))
+    lines = ['(function () {', '    var CLASS_CATALOG = [']
+    n = 0
+    for c in range(classes):
+        lines += [
+            '        {',
+            f"            id: 'class-{c}',",
+            f"            name: 'Synthetic Class {c}',",
+            f"            classIcon: 'class-{c}-icon',",
+            f"            description: 'Generated class {c} for benchmarking.',",
+            "            gradient: 'linear-gradient(135deg, #6366f1, #4f46e5)',",
+            '            topics: [',
+        ]
+        for t in range(topics_per_class):
+            count = per_topic if (c, t) != (classes - 1, topics_per_class - 1) else guide_count - n
+            guides = []
+            for _ in range(max(0, count)):
+                guides.append(f"                        {{ name: 'Guide Number {n}', file: 'guide-{n}' }}")
+                n += 1
+            lines += [
+                '                {',
+                f"                    category: 'Topic {c} {t} & Care',",
+                f"                    categoryIcon: 'topic-{t}-icon',",
+                "                    icon: 'fa-book',",
+                '                    guides: [',
+                ',\n'.join(guides),
+                '                    ],',
+                "                    comingSoon: [ { name: 'Later Guide', icon: 'later' } ]",
+                '                },' if t < topics_per_class - 1 else '                }',
+            ]
+        lines.append('            ]')
+        lines.append('        },' if c < classes - 1 else '        }')
+    lines += ['    ];', '})();', '']
+    return '\n'.join(lines)
+
+
+def best_of(fn, repeat):
+    times = []
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - t0)
+    return result, min(times), statistics.median(times)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    ap.add_argument('--guides', type=int, default=10000, help='synthetic guide count (default 10000)')
+    ap.add_argument('--repeat', type=int, default=3, help='runs per stage; best and median are reported')
+    args = ap.parse_args()
+
+    builder = load_builder()
+    src = synthetic_source(args.guides)
+    print(f'Synthetic my-guides-script.js: {args.guides} guides, {len(src) / 1024:.0f} KB')
+
+    classes, parse_best, parse_med = best_of(lambda: builder.extract_classes(src), args.repeat)
+    catalog, build_best, build_med = best_of(lambda: builder.build_catalog(classes), args.repeat)
+    assert len(catalog['guides']) == args.guides, 'synthetic guide count mismatch'
+
+    print(f'  extract_classes  best {parse_best * 1000:8.1f} ms   median {parse_med * 1000:8.1f} ms'
+          f'   ({parse_best / args.guides * 1e6:.2f} µs/guide)')
+    print(f'  build_catalog    best {build_best * 1000:8.1f} ms   median {build_med * 1000:8.1f} ms'
+          f'   ({build_best / args.guides * 1e6:.2f} µs/guide)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the Python build scripts, with a regression check.
+
+Times every pipeline stage on scaled synthetic fixtures and records the
+best wall time and the tracemalloc peak of each:
+
+    catalog.extract    parse a 10,000-guide CLASS_CATALOG (bench-guide-catalog.py's fixture)
+    catalog.build      build_catalog() on it
+    catalog.index      build_keyword_index() on the result
+    catalog.compact    encode_catalog() to the compact binary form
+    verify.check       verify-guide.py check() on 500 guides (the real guides,
+                       cloned into a temp checkout; no result cache). Tracing
+                       slows GuideScanner ~10x, so its memory peak is taken
+                       over the first 50 guides, which cover every source guide
+    pdf.render         render a 100-page content spec through pdf_engine
+    pdf.personalize    stamp and write one copy of that document (layout reused)
+
+Usage:
+    python3 scripts/bench-suite.py                    # run, compare with the baseline
+    python3 scripts/bench-suite.py --save             # run and store as the new baseline
+    python3 scripts/bench-suite.py --only catalog,pdf --repeat 5
+
+The baseline lives in scripts/bench-baseline.json. Wall times only compare
+meaningfully on the machine that recorded them, so re-save it after a
+hardware change. A stage regresses when its time exceeds the baseline by
+more than --tolerance (default 25%) or its peak memory by more than
+--mem-tolerance (default 10%); the run then exits 1.
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+REPO_ROOT = HERE.parent
+BASELINE = HERE / 'bench-baseline.json'
+
+CATALOG_GUIDES = 10000
+VERIFY_GUIDES = 500
+PDF_PAGES = 100
+
+
+def load_script(name, filename):
+    """Import a hyphenated script from scripts/ by path."""
+    spec = importlib.util.spec_from_file_location(name, HERE / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ── Fixtures ──
+# Each returns {stage name: zero-argument callable, or (timed, traced) pair
+# when the memory peak is measured on a smaller slice}. Building the
+# fixture is not timed; only the callables are.
+
+def catalog_stages():
+    sys.path.insert(0, str(HERE))
+    builder = load_script('build_guide_catalog', 'build-guide-catalog.py')
+    fixture = load_script('bench_guide_catalog', 'bench-guide-catalog.py')
+    from compact_catalog import encode_catalog
+
+    src = fixture.synthetic_source(CATALOG_GUIDES)
+    classes = builder.extract_classes(src)
+    catalog = builder.build_catalog(classes)
+    return {
+        'catalog.extract': lambda: builder.extract_classes(src),
+        'catalog.build': lambda: builder.build_catalog(classes),
+        'catalog.index': lambda: builder.build_keyword_index(catalog['guides']),
+        'catalog.compact': lambda: encode_catalog(catalog),
+    }
+
+
+def clone_guides(root, count):
+    """Copy the stylesheets and count guides (cycling the real ones) under root."""
+    guides = REPO_ROOT / 'guides'
+    for rel in ('guides/guide.css', 'guides/guide-sidebar.css'):
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(REPO_ROOT / rel, root / rel)
+    (root / 'guides' / 'configs').mkdir()
+    (root / 'guides' / 'quiz' / 'data').mkdir(parents=True)
+    sources = sorted(p.stem for p in guides.glob('*.html') if (guides / 'configs' / f'{p.stem}-config.js').exists())
+    ids = []
+    for i in range(count):
+        src = sources[i % len(sources)]
+        gid = f'{src}-{i:04d}'
+        shutil.copy(guides / f'{src}.html', root / 'guides' / f'{gid}.html')
+        shutil.copy(guides / 'configs' / f'{src}-config.js', root / 'guides' / 'configs' / f'{gid}-config.js')
+        quiz = guides / 'quiz' / 'data' / f'{src}-questions.js'
+        if quiz.exists():
+            shutil.copy(quiz, root / 'guides' / 'quiz' / 'data' / f'{gid}-questions.js')
+        ids.append(gid)
+    return ids
+
+
+def verify_stages(tmp):
+    root = Path(tmp) / 'verify'
+    ids = clone_guides(root, VERIFY_GUIDES)
+    # verify-guide.py fixes ROOT at import time
+    saved = os.environ.get('VERIFY_GUIDE_ROOT')
+    os.environ['VERIFY_GUIDE_ROOT'] = str(root)
+    try:
+        vg = load_script('verify_guide', 'verify-guide.py')
+    finally:
+        if saved is None:
+            del os.environ['VERIFY_GUIDE_ROOT']
+        else:
+            os.environ['VERIFY_GUIDE_ROOT'] = saved
+    vg.css_index()  # built once per process, like a real --all run
+    return {'verify.check': (lambda: [vg.safe_check(gid) for gid in ids],
+                             lambda: [vg.safe_check(gid) for gid in ids[:50]])}
+
+
+def synthetic_spec(sections):
+    """A content spec exercising every block type, about two sections per page."""
+    blocks = []
+    for n in range(sections):
+        blocks += [
+            {'type': 'heading', 'text': f'Section {n + 1}: Priority Assessment'},
+            {'type': 'paragraph', 'text': 'Assess airway, breathing and circulation first, then reassess '
+                                          'after every intervention and document the response. ' * 3},
+            {'type': 'bullets', 'items': [
+                {'label': 'Recognize', 'text': 'Early warning signs and trends across the shift.'},
+                'Escalate a deteriorating patient using SBAR.',
+                'Verify orders against the MAR before administration.',
+            ]},
+            {'type': 'box', 'background': 'LIGHT_BLUE', 'border': 'PRIMARY_COLOR', 'valign': 'TOP',
+             'header': '<b>Remember:</b>', 'items': ['Safety first.', 'Reassess.']},
+            {'type': 'item_table', 'items': [{'label': 'Normal', 'text': '60-100 bpm'},
+                                             {'label': 'Report', 'text': 'Below 50 or above 120 bpm'}]},
+            {'type': 'spacer', 'height': 0.12},
+        ]
+    return {'title': 'Synthetic Benchmark Guide', 'subtitle': f'{sections} sections', 'blocks': blocks}
+
+
+def pdf_stages():
+    sys.path.insert(0, str(REPO_ROOT / 'pdf_generators'))
+    from pdf_engine import render_spec
+    from personalize import Layout
+
+    spec = synthetic_spec(PDF_PAGES * 2)
+    layout = Layout(spec)
+    pages = len(layout.pages)
+    return {
+        'pdf.render': lambda: render_spec(spec),
+        'pdf.personalize': lambda: layout.render(stamp='Prepared for Benchmark Student · State University'),
+    }, pages
+
+
+# ── Measurement ──
+
+def measure(fn, repeat):
+    """Best wall time over repeat runs, then one traced run for the memory peak."""
+    fn, traced = fn if isinstance(fn, tuple) else (fn, fn)
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    gc.collect()
+    tracemalloc.start()
+    traced()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def compare(stage, result, baseline, tolerance, mem_tolerance):
+    """Return a list of regression messages for one stage."""
+    base = baseline.get(stage)
+    if not base:
+        return []
+    problems = []
+    if result['seconds'] > base['seconds'] * (1 + tolerance):
+        problems.append(f"{stage}: {result['seconds'] * 1000:.1f} ms vs baseline {base['seconds'] * 1000:.1f} ms")
+    if result['peak_bytes'] > base['peak_bytes'] * (1 + mem_tolerance):
+        problems.append(f"{stage}: peak {result['peak_bytes'] / 1024:.0f} KB vs baseline "
+                        f"{base['peak_bytes'] / 1024:.0f} KB")
+    return problems
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    ap.add_argument('--only', help='comma-separated stage groups or stages (catalog, verify, pdf, pdf.render, ...)')
+    ap.add_argument('--repeat', type=int, default=3, help='timed runs per stage; the best is kept (default 3)')
+    ap.add_argument('--save', action='store_true', help='store this run as the new baseline')
+    ap.add_argument('--tolerance', type=float, default=0.25, help='allowed wall-time regression (default 0.25)')
+    ap.add_argument('--mem-tolerance', type=float, default=0.10, help='allowed peak-memory regression (default 0.10)')
+    args = ap.parse_args()
+    wanted = set(args.only.split(',')) if args.only else None
+
+    def selected(stage):
+        return wanted is None or stage in wanted or stage.split('.')[0] in wanted
+
+    try:
+        baseline = json.loads(BASELINE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        baseline = {}
+    base_stages = baseline.get('stages', {})
+
+    results = {}
+    problems = []
+    with tempfile.TemporaryDirectory() as tmp:
+        groups = []
+        if any(selected(s) for s in ('catalog.extract', 'catalog.build', 'catalog.index', 'catalog.compact')):
+            groups.append(('catalog', f'{CATALOG_GUIDES} guides', catalog_stages))
+        if selected('verify.check'):
+            groups.append(('verify', f'{VERIFY_GUIDES} guides', lambda: verify_stages(tmp)))
+        if selected('pdf.render') or selected('pdf.personalize'):
+            groups.append(('pdf', None, pdf_stages))
+
+        for group, label, make in groups:
+            stages = make()
+            if group == 'pdf':
+                stages, pages = stages
+                label = f'{pages} pages'
+            print(f'{group} ({label})')
+            for stage, fn in stages.items():
+                if not selected(stage):
+                    continue
+                seconds, peak = measure(fn, args.repeat)
+                results[stage] = {'seconds': round(seconds, 6), 'peak_bytes': peak}
+                base = base_stages.get(stage)
+                delta = f"  {(seconds / base['seconds'] - 1) * 100:+5.0f}%" if base else ''
+                print(f'  {stage:<17} {seconds * 1000:9.1f} ms  peak {peak / 1024 / 1024:7.1f} MB{delta}')
+                problems += compare(stage, results[stage], base_stages, args.tolerance, args.mem_tolerance)
+
+    if args.save:
+        stages = dict(base_stages, **results)
+        BASELINE.write_text(json.dumps({
+            'machine': f'{platform.machine()} / python {platform.python_version()}',
+            'repeat': args.repeat,
+            'stages': dict(sorted(stages.items())),
+        }, indent=2) + '\n', encoding='utf-8')
+        print(f'Baseline saved to {BASELINE.relative_to(REPO_ROOT)}')
+        return
+
+    if not base_stages:
+        print('No baseline yet; run with --save to record one.')
+    elif problems:
+        print('\nRegressions:')
+        for p in problems:
+            print(f'  {p}')
+        sys.exit(1)
+    else:
+        print('\nNo regressions against the baseline.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Benchmark verify-guide.py's GuideScanner against the old regex views.
+
+    bench-verify-guide.py [guide] [--repeat N]    (default: pituitary-disorders, the largest)
+
+REGEX_VIEWS below is the whole-document regex implementation check() used
+before GuideScanner; it is kept here only as the reference to time and to
+cross-check against. Reports best wall time and tracemalloc peak for each.
+"""
+import argparse, importlib.util, os, re, statistics, time, tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+spec = importlib.util.spec_from_file_location('verify_guide', os.path.join(HERE, 'verify-guide.py'))
+vg = importlib.util.module_from_spec(spec); spec.loader.exec_module(vg)
+
+TAG = re.compile(r'<[^>]+>')
+
+def regex_views(path):
+    s = open(path, encoding='utf-8').read()
+    nostyle = re.sub(r'<style.*?</style>|<script.*?</script>', '', s, flags=re.S)
+    txt = TAG.sub(' ', nostyle)
+    body = s.split('<div class="document-content">', 1)[1]
+    t = ' '.join(re.sub(r'\s+', ' ', TAG.sub(' ', x)) for x in re.findall(r'<p[^>]*>(.*?)</p>', body, flags=re.S))
+    lens = [len(x.split()) for x in re.split(r'(?<=[.!?]) ', t) if len(x.split()) > 2]
+    used = set()
+    for m in re.finditer(r'class="([^"]+)"', re.sub(r'<style.*?</style>', '', s, flags=re.S)):
+        used |= {c for c in m.group(1).split() if not c.startswith('fa')}
+    rows = []
+    nm = re.search(r'id="numbers-cold".*?<tbody>(.*?)</tbody>', s, re.S)
+    if nm:
+        for row in re.findall(r'<tr>(.*?)</tr>', nm.group(1), re.S):
+            cells = [re.sub(r'\s+', ' ', TAG.sub('', c)).strip() for c in re.findall(r'<td>(.*?)</td>', row, re.S)]
+            if len(cells) >= 2: rows.append(tuple(cells[:2]))
+    return {
+        'em': txt.count('—'), 'excl': txt.count('!'),
+        'div': (len(re.findall(r'<div\b', s)), s.count('</div>')),
+        'section': (len(re.findall(r'<section\b', s)), s.count('</section>')),
+        'lens': lens, 'classes': used, 'rows': rows,
+        'tips': set(re.findall(r'class="florencebot-tip" id="([^"]+)"', s)),
+        'sections': set(re.findall(r'<section class="[^"]*" id="([^"]+)"', s)),
+    }
+
+def scanner_views(path):
+    h = vg.Doc.__new__(vg.Doc); vg.Doc.__init__(h, os.path.basename(path)[:-5]); h = h.html
+    return {
+        'em': h.em, 'excl': h.excl, 'div': tuple(h.div), 'section': tuple(h.section),
+        'lens': list(h.sentence_lengths), 'classes': set(h.classes), 'rows': h.numbers_rows,
+        'tips': h.tips, 'sections': h.sections,
+    }
+
+def measure(fn, path, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter(); result = fn(path); times.append(time.perf_counter() - t0)
+    tracemalloc.start(); fn(path); peak = tracemalloc.get_traced_memory()[1]; tracemalloc.stop()
+    return result, min(times), statistics.median(times), peak
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('guide', nargs='?', default='pituitary-disorders')
+    ap.add_argument('--repeat', type=int, default=20)
+    a = ap.parse_args()
+    path = os.path.join(vg.ROOT, 'guides', a.guide + '.html')
+    print('%s: %.0f KB' % (a.guide, os.path.getsize(path) / 1024))
+    ref = None
+    for name, fn in (('regex', regex_views), ('scanner', scanner_views)):
+        result, best, med, peak = measure(fn, path, a.repeat)
+        print('  %-7s best %7.2f ms  median %7.2f ms  peak %6.0f KB' % (name, best * 1e3, med * 1e3, peak / 1024))
+        if ref is None: ref = result
+        elif result != ref:
+            print('  !! views differ: %s' % sorted(k for k in ref if ref[k] != result[k]))
+
+if __name__ == '__main__':
+    main()
@@ -8,20 +8,57 @@ CLAUDE.md step 7), so we just derive a structured JSON from it that
 the backend can consume.
 
 Usage:
-    python3 scripts/build-guide-catalog.py
-
-Regenerates guides/catalog.json. Commit the result.
+    python3 scripts/build-guide-catalog.py [--force] [--compact]
+
+Regenerates guides/catalog.json and its inverted keyword index,
+guides/catalog-index.json. Commit the result.
+
+Builds are incremental: a cache in .cache/ (gitignored) keyed on the
+source hash and per-class content hashes lets unchanged classes be
+reused, and catalog.json (including generated_at) is only rewritten
+when guide content actually changed. --force ignores the cache.
+
+--compact also writes guides/catalog.bin, a binary catalog with an
+interned string table that compact_catalog.CompactCatalog can
+memory-map and decode one guide at a time. Nothing on the site serves
+it, so it is gitignored: build it where it is read.
+
+--profile runs the build under cProfile and prints per-stage wall times
+(read, parse, enrich, index, serialize, compact) and the top functions
+by own time; --profile-dump FILE also saves the raw pstats data for
+snakeviz/pstats (and implies --profile). Stage times include the
+profiler's overhead.
+
+--watch builds once, then keeps polling my-guides-script.js. Saves that
+leave the parsed CLASS_CATALOG unchanged (edits to the rest of the
+script) cost one parse; the catalog is only rebuilt when the classes,
+topics or guides actually changed.
 """
 
+import argparse
+import cProfile
+import hashlib
 import json
+import pstats
 import re
 import sys
 import datetime
+import time
+from contextlib import contextmanager
 from pathlib import Path
 
+from compact_catalog import encode_catalog
+from js_literal import LiteralParser
+from watch_files import watch
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 SRC = REPO_ROOT / 'my-guides-script.js'
 OUT = REPO_ROOT / 'guides' / 'catalog.json'
+INDEX_OUT = REPO_ROOT / 'guides' / 'catalog-index.json'
+COMPACT_OUT = REPO_ROOT / 'guides' / 'catalog.bin'
+CACHE = REPO_ROOT / '.cache' / 'guide-catalog.json'
+CACHE_VERSION = 1
+PARSER_SRC = Path(__file__).resolve().parent / 'js_literal.py'
 
 
 # ── Keyword enrichment by category slug ──────────────────────────
@@ -75,169 +112,107 @@ def tokenize(s):
     return [t for t in tokens if t not in STOP and len(t) > 1]
 
 
+def parse_class_catalog(js_src):
+    """Return the raw CLASS_CATALOG literal from my-guides-script.js as Python data."""
+    start_match = re.search(r'var\s+CLASS_CATALOG\s*=\s*(?=\[)', js_src)
+    if not start_match:
+        raise RuntimeError('Could not find CLASS_CATALOG in source')
+    return LiteralParser(js_src, start_match.end()).parse_value()
+
+
 def extract_classes(js_src):
     """
     Walk my-guides-script.js to extract each class entry:
-      [{ id, name, topics: [{ category, guides: [{ name, file }] }] }]
+      [{ id, name, topics: [{ category_name, guides: [{ name, file }] }] }]
 
-    Relies on regex rather than a full JS parser, which is fine because
-    CLASS_CATALOG has a predictable shape. If this breaks, CLASS_CATALOG
-    was reformatted — adjust the regexes.
+    CLASS_CATALOG is parsed as a JS literal in one linear scan, so key
+    order and formatting inside the entries no longer matter. Classes
+    without an id/name, topics without a guides array and guides
+    without a file (e.g. comingSoon entries) are skipped.
     """
-    # Find the CLASS_CATALOG block
-    start_match = re.search(r'var\s+CLASS_CATALOG\s*=\s*\[', js_src)
-    if not start_match:
-        raise RuntimeError('Could not find CLASS_CATALOG in source')
-
-    # Walk character by character to find the matching closing bracket
-    depth = 0
-    i = start_match.end() - 1  # points at the opening '['
-    end = None
-    in_string = False
-    string_char = None
-    prev = ''
-    while i < len(js_src):
-        ch = js_src[i]
-        if in_string:
-            if ch == string_char and prev != '\\':
-                in_string = False
-        else:
-            if ch in ("'", '"'):
-                in_string = True
-                string_char = ch
-            elif ch == '[':
-                depth += 1
-            elif ch == ']':
-                depth -= 1
-                if depth == 0:
-                    end = i
-                    break
-        prev = ch
-        i += 1
-
-    if end is None:
-        raise RuntimeError('Unterminated CLASS_CATALOG array')
-
-    block = js_src[start_match.end() - 1:end + 1]
-
-    # Split into class entries: each is a top-level object at depth 1
-    classes = []
-    depth = 0
-    cur_start = None
-    i = 0
-    in_string = False
-    string_char = None
-    prev = ''
-    while i < len(block):
-        ch = block[i]
-        if in_string:
-            if ch == string_char and prev != '\\':
-                in_string = False
-        else:
-            if ch in ("'", '"'):
-                in_string = True
-                string_char = ch
-            elif ch == '{':
-                if depth == 0:
-                    cur_start = i
-                depth += 1
-            elif ch == '}':
-                depth -= 1
-                if depth == 0 and cur_start is not None:
-                    classes.append(block[cur_start:i + 1])
-                    cur_start = None
-        prev = ch
-        i += 1
-
     out = []
-    for class_block in classes:
-        class_id_m = re.search(r"\bid\s*:\s*'([^']+)'", class_block)
-        class_name_m = re.search(r"\bname\s*:\s*'([^']+)'", class_block)
-        if not class_id_m or not class_name_m:
+    for cls in parse_class_catalog(js_src):
+        if not isinstance(cls, dict) or not cls.get('id') or not cls.get('name'):
             continue
-        class_id = class_id_m.group(1)
-        class_name = class_name_m.group(1)
 
-        # Extract each topic category: find { category: '...', ..., guides: [...] }
-        topic_iter = re.finditer(r"category\s*:\s*'([^']+)'", class_block)
         topics_meta = []
-        for m in topic_iter:
-            # Find the guides array that belongs to this category
-            # by scanning forward until we hit 'guides: ['
-            region = class_block[m.end():]
-            guides_m = re.search(r"guides\s*:\s*\[", region)
-            if not guides_m:
+        for topic in cls.get('topics') or []:
+            if not isinstance(topic, dict) or not topic.get('category'):
                 continue
-            # Walk to find the matching closing bracket of this guides array
-            gdepth = 1
-            gi = guides_m.end()
-            in_s = False
-            sc = None
-            gp = ''
-            while gi < len(region) and gdepth > 0:
-                c = region[gi]
-                if in_s:
-                    if c == sc and gp != '\\':
-                        in_s = False
-                else:
-                    if c in ("'", '"'):
-                        in_s = True
-                        sc = c
-                    elif c == '[':
-                        gdepth += 1
-                    elif c == ']':
-                        gdepth -= 1
-                gp = c
-                gi += 1
-            guides_text = region[guides_m.end():gi - 1]
-
-            guides = []
-            for gm in re.finditer(r"\{\s*name\s*:\s*'([^']+)'\s*,\s*file\s*:\s*'([^']+)'\s*\}", guides_text):
-                guides.append({'name': gm.group(1), 'file': gm.group(2)})
-
+            if not isinstance(topic.get('guides'), list):
+                continue
+            guides = [
+                {'name': g['name'], 'file': g['file']}
+                for g in topic['guides']
+                if isinstance(g, dict) and g.get('name') and g.get('file')
+            ]
             topics_meta.append({
-                'category_name': m.group(1),
+                'category_name': topic['category'],
                 'guides': guides,
             })
 
         out.append({
-            'id': class_id,
-            'name': class_name,
+            'id': cls['id'],
+            'name': cls['name'],
             'topics': topics_meta,
         })
 
     return out
 
 
-def build_catalog(classes):
+def class_block_hash(cls):
+    """Content hash of one extracted class entry (id, name, topics, guides)."""
+    return sha256(json.dumps(cls, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+
+
+def build_class_guides(cls):
+    """Build the catalog entries for every guide in one class."""
+    guides = {}
+    class_id = cls['id']
+    class_name = cls['name']
+    population = POPULATION_BY_CLASS.get(class_id, 'mixed')
+
+    for topic in cls['topics']:
+        category_name = topic['category_name']
+        category_slug = slugify(category_name)
+        category_keywords = CATEGORY_SYNONYMS.get(category_slug, [])
+
+        for g in topic['guides']:
+            # Keyword set: class name tokens + category tokens + synonyms + title tokens
+            keywords = set()
+            keywords.update(tokenize(class_name))
+            keywords.update(tokenize(category_name))
+            keywords.update(category_keywords)
+            keywords.update(tokenize(g['name']))
+
+            guides[g['file']] = {
+                'title': g['name'],
+                'class': class_id,
+                'class_name': class_name,
+                'category': category_slug,
+                'category_name': category_name,
+                'population': population,
+                'keywords': sorted(keywords),
+            }
+
+    return guides
+
+
+def build_catalog(classes, block_cache=None):
+    """
+    Build the catalog dict. If block_cache (class block hash → guide
+    entries) is given, unchanged classes are reused from it and newly
+    built classes are added to it in place.
+    """
     guides = {}
     for cls in classes:
-        class_id = cls['id']
-        class_name = cls['name']
-        population = POPULATION_BY_CLASS.get(class_id, 'mixed')
-
-        for topic in cls['topics']:
-            category_name = topic['category_name']
-            category_slug = slugify(category_name)
-            category_keywords = CATEGORY_SYNONYMS.get(category_slug, [])
-
-            for g in topic['guides']:
-                # Keyword set: class name tokens + category tokens + synonyms + title tokens
-                keywords = set()
-                keywords.update(tokenize(class_name))
-                keywords.update(tokenize(category_name))
-                keywords.update(category_keywords)
-                keywords.update(tokenize(g['name']))
-
-                guides[g['file']] = {
-                    'title': g['name'],
-                    'class': class_id,
-                    'class_name': class_name,
-                    'category': category_slug,
-                    'category_name': category_name,
-                    'population': population,
-                    'keywords': sorted(keywords),
-                }
+        if block_cache is None:
+            guides.update(build_class_guides(cls))
+            continue
+        key = class_block_hash(cls)
+        if key not in block_cache:
+            block_cache[key] = build_class_guides(cls)
+        guides.update(block_cache[key])
 
     return {
         'version': 1,
@@ -246,22 +221,261 @@ def build_catalog(classes):
     }
 
 
+# ── Inverted keyword index ───────────────────────────────────────
+# guides/catalog-index.json lets the backend answer "which guides match
+# 'cardiac'" with a dict lookup instead of scanning catalog['guides']:
+#   keywords: keyword → { df, guides: [guide ids] }
+#   prefixes: 2-4 char prefix → [keywords], for type-ahead / partial words
+# It carries no timestamp, so it only changes when the keywords do.
+
+INDEX_PREFIX_LENGTHS = (2, 3, 4)
+
+
+def build_keyword_index(guides):
+    postings = {}
+    for guide_id, entry in guides.items():
+        for kw in entry['keywords']:
+            postings.setdefault(kw, []).append(guide_id)
+
+    prefixes = {}
+    for kw in postings:
+        for n in INDEX_PREFIX_LENGTHS:
+            if len(kw) >= n:
+                prefixes.setdefault(kw[:n], []).append(kw)
+
+    return {
+        'version': 1,
+        'guide_count': len(guides),
+        'keywords': {
+            kw: {'df': len(ids), 'guides': sorted(ids)}
+            for kw, ids in sorted(postings.items())
+        },
+        'prefixes': {p: sorted(kws) for p, kws in sorted(prefixes.items())},
+    }
+
+
+# ── Build cache ──────────────────────────────────────────────────
+# .cache/guide-catalog.json remembers the hash of the last source we
+# built from, the hash of the catalog we wrote, and the guide entries
+# for each class block. The builder's own source (and the literal
+# parser's) is part of the key so editing CATEGORY_SYNONYMS etc.
+# invalidates everything.
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_cache(builder_hash):
+    try:
+        cache = json.loads(CACHE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != CACHE_VERSION or cache.get('builder') != builder_hash:
+        return {}
+    return cache
+
+
+def save_cache(cache):
+    try:
+        CACHE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE.write_text(json.dumps(cache, ensure_ascii=False) + '\n', encoding='utf-8')
+    except OSError as e:
+        print(f'WARNING: could not write build cache {CACHE}: {e}', file=sys.stderr)
+
+
+def read_bytes_or_none(path):
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def read_existing_catalog():
+    try:
+        raw = OUT.read_bytes()
+        return raw, json.loads(raw)
+    except (OSError, ValueError):
+        return None, None
+
+
+# ── Profiling ──
+
+class Stages:
+    """Accumulated wall time per named build stage, in first-seen order."""
+
+    def __init__(self):
+        self.seconds = {}
+
+    @contextmanager
+    def __call__(self, name):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - t0
+
+
+def print_profile(stages, profiler, top, dump=None):
+    total = sum(stages.seconds.values())
+    print('\nStage timings:')
+    for name, seconds in stages.seconds.items():
+        share = seconds / total * 100 if total else 0.0
+        print(f'  {name:<10} {seconds * 1000:9.2f} ms  {share:5.1f}%')
+    print(f'  {"total":<10} {total * 1000:9.2f} ms')
+
+    stats = pstats.Stats(profiler)
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+    print(f'\nTop {len(rows)} functions by own time:')
+    print(f'  {"own ms":>9} {"cum ms":>9} {"calls":>9}  function')
+    for (filename, line, func), (_, calls, own, cum, _) in rows:
+        where = f'{Path(filename).name}:{line}' if line else filename
+        print(f'  {own * 1000:9.2f} {cum * 1000:9.2f} {calls:9d}  {func} ({where})')
+    if dump:
+        stats.dump_stats(dump)
+        print(f'\n✓ Wrote profile data to {dump} (python3 -m pstats {dump})')
+
+
 def main():
+    ap = argparse.ArgumentParser(description='Build guides/catalog.json from CLASS_CATALOG.')
+    ap.add_argument('--force', action='store_true',
+                    help='ignore the build cache and rewrite catalog.json even if unchanged')
+    ap.add_argument('--compact', action='store_true',
+                    help='also write guides/catalog.bin (interned strings, lazily readable; see compact_catalog.py)')
+    ap.add_argument('--profile', action='store_true',
+                    help='print per-stage timings and the hottest functions (runs under cProfile)')
+    ap.add_argument('--profile-dump', metavar='FILE',
+                    help='save the pstats data to FILE (implies --profile)')
+    ap.add_argument('--profile-top', type=int, default=15, metavar='N',
+                    help='functions to list with --profile (default 15)')
+    ap.add_argument('--watch', action='store_true',
+                    help='keep running and rebuild whenever CLASS_CATALOG changes')
+    args = ap.parse_args()
+
+    stages = Stages()
+    if args.watch:
+        watch_catalog(args)
+        return
+    if not (args.profile or args.profile_dump):
+        build(args, stages)
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        build(args, stages)
+    finally:
+        profiler.disable()
+        print_profile(stages, profiler, args.profile_top, args.profile_dump)
+
+
+def watch_catalog(args):
+    """Build, then rebuild on every save that changes the parsed CLASS_CATALOG, until Ctrl-C."""
+    build(args, Stages())
+    classes = extract_classes(SRC.read_text(encoding='utf-8'))
+    print(f'Watching {SRC.relative_to(REPO_ROOT)} for CLASS_CATALOG changes (Ctrl-C to stop)', file=sys.stderr)
+    try:
+        for _ in watch(lambda: [SRC]):
+            t0 = time.perf_counter()
+            try:
+                latest = extract_classes(SRC.read_text(encoding='utf-8'))
+            except (OSError, RuntimeError) as e:
+                print(f'ERROR: {e}', file=sys.stderr)
+                continue
+            if latest == classes:
+                print(f'  CLASS_CATALOG unchanged, catalog not rebuilt ({(time.perf_counter() - t0) * 1000:.0f} ms)',
+                      file=sys.stderr)
+                continue
+            classes = latest
+            build(args, Stages())
+            print(f'  rebuilt in {(time.perf_counter() - t0) * 1000:.0f} ms', file=sys.stderr, flush=True)
+    except KeyboardInterrupt:
+        pass
+
+
+def build(args, stage):
     if not SRC.exists():
         print(f'ERROR: {SRC} not found', file=sys.stderr)
         sys.exit(1)
 
-    js_src = SRC.read_text(encoding='utf-8')
-    classes = extract_classes(js_src)
-
-    catalog = build_catalog(classes)
-
-    OUT.parent.mkdir(parents=True, exist_ok=True)
-    OUT.write_text(json.dumps(catalog, indent=2) + '\n', encoding='utf-8')
+    with stage('read'):
+        src_bytes = SRC.read_bytes()
+        src_hash = sha256(src_bytes)
+        builder_hash = sha256(Path(__file__).read_bytes() + PARSER_SRC.read_bytes())
+        cache = {} if args.force else load_cache(builder_hash)
+        out_rel = OUT.relative_to(REPO_ROOT)
+
+        # Fast path: same source, same builder, outputs untouched since we wrote them.
+        existing_raw, existing = read_existing_catalog()
+        index_raw = read_bytes_or_none(INDEX_OUT)
+        compact_raw = read_bytes_or_none(COMPACT_OUT) if args.compact else None
+    if (cache.get('source') == src_hash and existing_raw is not None and index_raw is not None
+            and cache.get('output') == sha256(existing_raw)
+            and cache.get('index') == sha256(index_raw)
+            and (not args.compact or (compact_raw is not None
+                                      and cache.get('compact') == sha256(compact_raw)))):
+        print(f'✓ {out_rel} up to date — {len(existing["guides"])} guides (source unchanged)')
+        return
+
+    with stage('parse'):
+        classes = extract_classes(src_bytes.decode('utf-8'))
+
+    old_blocks = cache.get('blocks', {})
+    block_cache = dict(old_blocks)
+    with stage('enrich'):
+        catalog = build_catalog(classes, block_cache)
+    used = {class_block_hash(cls) for cls in classes}
+    reused = sum(1 for key in used if key in old_blocks)
+
+    # Only rewrite (and bump generated_at) when the guide content changed.
+    unchanged = (not args.force and existing is not None
+                 and existing.get('version') == catalog['version']
+                 and existing.get('guides') == catalog['guides'])
+    if unchanged:
+        out_raw = existing_raw
+        catalog = existing
+    else:
+        with stage('serialize'):
+            out_raw = (json.dumps(catalog, indent=2) + '\n').encode('utf-8')
+            OUT.parent.mkdir(parents=True, exist_ok=True)
+            OUT.write_bytes(out_raw)
+
+    with stage('index'):
+        index = build_keyword_index(catalog['guides'])
+    with stage('serialize'):
+        new_index_raw = (json.dumps(index, indent=2) + '\n').encode('utf-8')
+        if new_index_raw != index_raw:
+            INDEX_OUT.write_bytes(new_index_raw)
+            print(f'✓ Wrote {INDEX_OUT.relative_to(REPO_ROOT)}')
+
+    if args.compact:
+        with stage('compact'):
+            new_compact_raw = encode_catalog(catalog)
+        if new_compact_raw != compact_raw:
+            COMPACT_OUT.write_bytes(new_compact_raw)
+            print(f'✓ Wrote {COMPACT_OUT.relative_to(REPO_ROOT)} — {len(new_compact_raw)} bytes '
+                  f'(catalog.json is {len(out_raw)} bytes)')
+        compact_hash = sha256(new_compact_raw)
+    else:
+        compact_hash = cache.get('compact')
+
+    with stage('serialize'):
+        save_cache({
+            'version': CACHE_VERSION,
+            'builder': builder_hash,
+            'source': src_hash,
+            'output': sha256(out_raw),
+            'index': sha256(new_index_raw),
+            'compact': compact_hash,
+            'blocks': {key: block_cache[key] for key in used},
+        })
 
     guide_count = len(catalog['guides'])
     class_count = len(classes)
-    print(f'✓ Wrote {OUT.relative_to(REPO_ROOT)} — {guide_count} guides across {class_count} classes')
+    if unchanged:
+        print(f'✓ {out_rel} up to date — {guide_count} guides across {class_count} classes '
+              f'(guide content unchanged, {reused}/{class_count} classes cached)')
+    else:
+        print(f'✓ Wrote {out_rel} — {guide_count} guides across {class_count} classes '
+              f'({reused}/{class_count} classes cached)')
 
 
 if __name__ == '__main__':
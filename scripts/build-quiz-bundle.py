@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Build the compiled quiz bundle from guides/quiz/data/*-questions.js.
+
+Each question file assigns one `var <name>QuizData = {...}` literal. This
+parses every file with the same JS literal parser as the catalog build,
+validates the questions against what quiz-engine.js can render, and
+writes a minified JSON copy per guide:
+
+    guides/quiz/bundle/<slug>.<hash>.json   one guide's quiz data
+
+Bundle files are content-addressed (the hash is the first 12 hex digits
+of the file's SHA-256), so they can be served with an immutable cache
+policy (see _headers): a changed question bank gets a new file name,
+and stale bundles are removed. The slug -> file map is written into
+guides/quiz/quiz.html (its `var QUIZ_BUNDLES = {...};`), so the page
+fetches the bundle directly; it falls back to the .js file for a guide
+without a bundle. quiz.html is only rewritten when the map changed.
+
+data/<slug>-questions.js is what authors edit, but quiz.html serves
+the bundle: an edited question file ships nothing until this is rerun.
+(The older per-guide pages, guides/quiz/<slug>-quiz.html, are not linked
+from the site any more and still load the .js file directly.)
+
+Usage:
+    python3 scripts/build-quiz-bundle.py [--check]
+
+--check writes nothing: it validates, then exits 1 if the committed
+bundle is out of date — a bundle file missing, changed or left over in
+guides/quiz/bundle/, or quiz.html's QUIZ_BUNDLES map not matching.
+Any validation error exits 1 before anything is written; warnings (e.g.
+a question type the engine has no renderer for) are printed but do not
+stop the build. Commit the result.
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+from js_literal import parse_var
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = REPO_ROOT / 'guides' / 'quiz' / 'data'
+OUT_DIR = REPO_ROOT / 'guides' / 'quiz' / 'bundle'
+QUIZ_PAGE = REPO_ROOT / 'guides' / 'quiz' / 'quiz.html'
+BUNDLE_MAP = re.compile(r'^( *)var QUIZ_BUNDLES = \{.*?\};', re.M | re.S)
+HASH_LENGTH = 12
+
+# Question types quiz-engine.js renders; anything else falls through to
+# the single-answer radio list.
+ENGINE_TYPES = {'single', 'sata', 'ordering', 'matrix'}
+SUBTYPES = {None, 'priority'}
+HEX_COLOR = re.compile(r'#[0-9a-fA-F]{6}')
+
+
+# ── Validation ───────────────────────────────────────────────────
+# Each check appends (level, message) to problems; level is 'error' or
+# 'warning'. Messages name the question so authors can find it.
+
+def _text(value):
+    return isinstance(value, str) and value.strip() != ''
+
+
+def validate_question(q, where, problems):
+    def error(msg):
+        problems.append(('error', f'{where}: {msg}'))
+
+    def warn(msg):
+        problems.append(('warning', f'{where}: {msg}'))
+
+    for key in ('stem', 'difficulty', 'guideSectionId'):
+        if not _text(q.get(key)):
+            error(f'missing {key}')
+
+    options = q.get('options')
+    if not isinstance(options, list) or len(options) < 2:
+        error('needs at least two options')
+        return
+    option_ids = []
+    for opt in options:
+        if not isinstance(opt, dict) or not _text(opt.get('id')) or not _text(opt.get('text')):
+            error(f'option {opt!r} needs an id and text')
+            return
+        option_ids.append(opt['id'])
+    if len(set(option_ids)) != len(option_ids):
+        error(f'duplicate option ids {option_ids}')
+    ids = set(option_ids)
+
+    qtype, correct = q.get('type'), q.get('correct')
+    if q.get('subtype') not in SUBTYPES:
+        warn(f"unknown subtype {q.get('subtype')!r}")
+    if qtype == 'ordering':
+        if not isinstance(correct, list) or sorted(correct) != sorted(option_ids):
+            error('ordering answer must list every option id exactly once')
+    elif qtype == 'matrix':
+        columns = q.get('matrixColumns')
+        if not isinstance(columns, list) or len(columns) < 2:
+            error('matrix question needs at least two matrixColumns')
+        elif not isinstance(correct, dict) or set(correct) != ids:
+            error('matrix answer must give a column for every option id')
+        elif not set(correct.values()) <= set(columns):
+            error(f'matrix answer uses columns not in matrixColumns: {sorted(set(correct.values()) - set(columns))}')
+    elif isinstance(correct, list):
+        if not correct or not set(correct) <= ids or len(set(correct)) != len(correct):
+            error(f'answer {correct!r} must be distinct option ids')
+        if qtype != 'sata':
+            warn(f"type {qtype!r} with several answers is rendered as single choice; use 'sata'")
+    elif correct not in ids:
+        error(f'answer {correct!r} is not an option id')
+    if qtype not in ENGINE_TYPES and not isinstance(correct, list):
+        warn(f'quiz-engine.js has no renderer for type {qtype!r}')
+
+    rationale = q.get('rationale')
+    if not isinstance(rationale, dict) or not _text(rationale.get('correct')):
+        error('rationale needs a correct explanation')
+    elif set(rationale) - {'correct'} - ids:
+        error(f"rationale explains unknown options {sorted(set(rationale) - {'correct'} - ids)}")
+
+    labs = q.get('labValues')
+    if labs is not None and not (isinstance(labs, list)
+                                 and all(isinstance(lv, dict) and _text(lv.get('name')) and _text(lv.get('normal'))
+                                         for lv in labs)):
+        error('labValues must be a list of {name, normal}')
+
+
+def validate_quiz(data, slug, problems):
+    """Validate one parsed quiz file; problems gets (level, message) pairs."""
+    if not isinstance(data, dict):
+        problems.append(('error', f'{slug}: quiz data is not an object'))
+        return
+    if data.get('guideSlug') != slug:
+        problems.append(('error', f"{slug}: guideSlug {data.get('guideSlug')!r} does not match the file name"))
+    for key in ('guideName', 'category'):
+        if not _text(data.get(key)):
+            problems.append(('error', f'{slug}: missing {key}'))
+    if not isinstance(data.get('categoryColor'), str) or not HEX_COLOR.fullmatch(data['categoryColor']):
+        problems.append(('error', f"{slug}: categoryColor {data.get('categoryColor')!r} is not #rrggbb"))
+    minutes = data.get('estimatedMinutes')
+    if not isinstance(minutes, int) or isinstance(minutes, bool) or minutes <= 0:
+        problems.append(('error', f'{slug}: estimatedMinutes must be a positive integer'))
+
+    questions = data.get('questions')
+    if not isinstance(questions, list) or not questions:
+        problems.append(('error', f'{slug}: no questions'))
+        return
+    seen = set()
+    for n, q in enumerate(questions, 1):
+        if not isinstance(q, dict):
+            problems.append(('error', f'{slug} question #{n}: not an object'))
+            continue
+        qid = q.get('id')
+        where = f'{slug} question {qid!r}'
+        if not isinstance(qid, (int, str)) or isinstance(qid, bool) or qid in seen:
+            problems.append(('error', f'{slug} question #{n}: id {qid!r} is missing or duplicated'))
+        seen.add(qid)
+        validate_question(q, where, problems)
+
+
+# ── Build ────────────────────────────────────────────────────────
+
+def compile_quiz(path):
+    """Parse one question file; returns (slug, data)."""
+    slug = path.name[:-len('-questions.js')]
+    try:
+        _, data = parse_var(path.read_text(encoding='utf-8'), r'\w+QuizData')
+    except RuntimeError as e:
+        raise RuntimeError(f'{path.relative_to(REPO_ROOT)}: {e}') from None
+    return slug, data
+
+
+def encode(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def bundle_name(slug, raw):
+    return f'{slug}.{hashlib.sha256(raw).hexdigest()[:HASH_LENGTH]}.json'
+
+
+def with_bundle_map(page, files):
+    """quiz.html's text with its QUIZ_BUNDLES map set to files (slug -> file name)."""
+    match = BUNDLE_MAP.search(page)
+    if not match:
+        raise RuntimeError(f'{QUIZ_PAGE.relative_to(REPO_ROOT)}: no `var QUIZ_BUNDLES = {{...}};` to update')
+    indent = match.group(1)
+    entries = ',\n'.join(f'{indent}    {json.dumps(slug)}: {json.dumps(name)}' for slug, name in files.items())
+    return f'{page[:match.start()]}{indent}var QUIZ_BUNDLES = {{\n{entries}\n{indent}}};{page[match.end():]}'
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Build the compiled quiz bundle from guides/quiz/data')
+    ap.add_argument('--check', action='store_true',
+                    help='validate and fail if the committed bundle or map is out of date; writes nothing')
+    args = ap.parse_args()
+
+    sources = sorted(DATA_DIR.glob('*-questions.js'))
+    if not sources:
+        print(f'ERROR: no question files in {DATA_DIR}', file=sys.stderr)
+        sys.exit(1)
+
+    problems = []
+    bundles = {}
+    source_bytes = 0
+    for path in sources:
+        try:
+            slug, data = compile_quiz(path)
+        except RuntimeError as e:
+            problems.append(('error', str(e)))
+            continue
+        validate_quiz(data, slug, problems)
+        raw = encode(data)
+        bundles[slug] = (bundle_name(slug, raw), raw, len(data.get('questions') or []))
+        source_bytes += path.stat().st_size
+
+    errors = [msg for level, msg in problems if level == 'error']
+    for level, msg in problems:
+        print(f'{level.upper()}: {msg}', file=sys.stderr)
+    if errors:
+        print(f'✗ {len(errors)} error(s); quiz bundle not written', file=sys.stderr)
+        sys.exit(1)
+
+    bundle_bytes = sum(len(raw) for _, raw, _ in bundles.values())
+    questions = sum(count for _, _, count in bundles.values())
+    summary = (f'{len(bundles)} quizzes, {questions} questions: {source_bytes / 1024:.0f} KB of JS -> '
+               f'{bundle_bytes / 1024:.0f} KB of JSON ({bundle_bytes / source_bytes:.0%})')
+    page = QUIZ_PAGE.read_text(encoding='utf-8')
+    try:
+        new_page = with_bundle_map(page, {slug: name for slug, (name, _, _) in bundles.items()})
+    except RuntimeError as e:
+        print(f'ERROR: {e}', file=sys.stderr)
+        sys.exit(1)
+    current = {name for name, _, _ in bundles.values()}
+    stale = [p for p in OUT_DIR.glob('*.json') if p.name not in current]
+    out_rel = QUIZ_PAGE.relative_to(REPO_ROOT)
+
+    if args.check:
+        outdated = [f'{out_rel}: QUIZ_BUNDLES map does not match the question files'] if new_page != page else []
+        for name, raw, _ in bundles.values():
+            target = OUT_DIR / name
+            if not target.exists():
+                outdated.append(f'{target.relative_to(REPO_ROOT)}: missing')
+            elif target.read_bytes() != raw:
+                outdated.append(f'{target.relative_to(REPO_ROOT)}: content differs from its question file')
+        outdated += [f'{p.relative_to(REPO_ROOT)}: no longer built' for p in stale]
+        for msg in outdated:
+            print(f'ERROR: {msg}', file=sys.stderr)
+        if outdated:
+            print('✗ quiz bundle out of date; run scripts/build-quiz-bundle.py and commit the result',
+                  file=sys.stderr)
+            sys.exit(1)
+        print(f'✓ {out_rel} up to date — {summary}')
+        return
+
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for name, raw, _ in bundles.values():
+        target = OUT_DIR / name
+        if not target.exists() or target.read_bytes() != raw:
+            target.write_bytes(raw)
+            written += 1
+    for p in stale:
+        p.unlink()
+
+    if new_page == page and not written and not stale:
+        print(f'✓ {out_rel} up to date — {summary}')
+        return
+    if new_page != page:
+        QUIZ_PAGE.write_text(new_page, encoding='utf-8')
+    print(f'✓ Updated {out_rel} — {summary} ({written} bundle(s) written, {len(stale)} removed)')
+
+
+if __name__ == '__main__':
+    main()
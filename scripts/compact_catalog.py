@@ -0,0 +1,199 @@
+"""
+Compact binary form of guides/catalog.json, and a lazy reader for it.
+
+build-guide-catalog.py --compact writes guides/catalog.bin next to the
+JSON catalog (gitignored; it is rebuilt from the committed JSON). Every string (guide ids, titles, class/category names,
+populations, keywords) is stored once in an interned string table and
+guides refer to it by index, so the repeated class_name/category_name/
+population strings cost four bytes each instead of a full copy.
+
+Layout (all integers little-endian u32 unless noted):
+
+    header      magic b'TNCC', format u16, catalog version u16,
+                string count, guide count, keyword ref count,
+                generated_at string index
+    offsets     string count + 1 byte offsets into the string data
+    guides      one fixed-size record per guide, sorted by guide id:
+                id, title, class, class_name, category, category_name,
+                population, first keyword ref, keyword count
+    order       guide count record indices, in catalog order
+    keywords    keyword string indices referenced by the guide records
+    strings     UTF-8 string data
+
+Reading is lazy: CompactCatalog memory-maps the file and only decodes
+the records and strings a lookup touches. A lookup by id is a binary
+search over the sorted records.
+
+    with CompactCatalog.open('guides/catalog.bin') as cat:
+        cat['heart-failure']['keywords']
+"""
+
+import mmap
+import struct
+
+MAGIC = b'TNCC'
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct('<4sHHIIII')
+U32 = struct.Struct('<I')
+GUIDE = struct.Struct('<9I')
+GUIDE_FIELDS = ('id', 'title', 'class', 'class_name', 'category', 'category_name', 'population')
+NO_STRING = 0xFFFFFFFF
+
+
+def encode_catalog(catalog):
+    """Encode a catalog dict (as built by build_catalog) to bytes."""
+    strings = []
+    interned = {}
+
+    def intern(s):
+        idx = interned.get(s)
+        if idx is None:
+            idx = interned[s] = len(strings)
+            strings.append(s)
+        return idx
+
+    guide_ids = list(catalog['guides'])
+    sorted_ids = sorted(guide_ids)
+    position = {gid: i for i, gid in enumerate(sorted_ids)}
+
+    records = bytearray()
+    keyword_refs = []
+    for gid in sorted_ids:
+        g = catalog['guides'][gid]
+        values = [gid, g['title'], g['class'], g['class_name'], g['category'], g['category_name'], g['population']]
+        refs = [intern(v) for v in values]
+        first = len(keyword_refs)
+        keyword_refs.extend(intern(kw) for kw in g['keywords'])
+        records += GUIDE.pack(*refs, first, len(g['keywords']))
+
+    generated_at = catalog.get('generated_at')
+    generated_ref = intern(generated_at) if generated_at is not None else NO_STRING
+
+    data = bytearray()
+    offsets = []
+    for s in strings:
+        offsets.append(len(data))
+        data += s.encode('utf-8')
+    offsets.append(len(data))
+
+    out = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, catalog.get('version', 1),
+                                len(strings), len(sorted_ids), len(keyword_refs), generated_ref))
+    out += struct.pack(f'<{len(offsets)}I', *offsets)
+    out += records
+    out += struct.pack(f'<{len(guide_ids)}I', *(position[gid] for gid in guide_ids))
+    out += struct.pack(f'<{len(keyword_refs)}I', *keyword_refs)
+    out += data
+    return bytes(out)
+
+
+class CompactCatalog:
+    """Read-only, lazily decoded view over a catalog.bin buffer."""
+
+    def __init__(self, buf, _closer=None):
+        self._buf = memoryview(buf)
+        self._closer = _closer
+        magic, fmt, version, n_strings, n_guides, n_refs, generated_ref = HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC:
+            raise ValueError('Not a compact guide catalog (bad magic)')
+        if fmt != FORMAT_VERSION:
+            raise ValueError(f'Unsupported compact catalog format {fmt}')
+        self.version = version
+        self._n_guides = n_guides
+        self._offsets_at = HEADER.size
+        self._guides_at = self._offsets_at + (n_strings + 1) * U32.size
+        self._order_at = self._guides_at + n_guides * GUIDE.size
+        self._refs_at = self._order_at + n_guides * U32.size
+        self._data_at = self._refs_at + n_refs * U32.size
+        self._strings = {}
+        self._generated_ref = generated_ref
+
+    @classmethod
+    def open(cls, path):
+        """Memory-map path; close() (or a with block) releases the mapping."""
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mm, _closer=mm.close)
+
+    def close(self):
+        self._buf.release()
+        if self._closer is not None:
+            self._closer()
+            self._closer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ── Decoding helpers ──
+
+    def _string(self, idx):
+        s = self._strings.get(idx)
+        if s is None:
+            start, end = struct.unpack_from('<2I', self._buf, self._offsets_at + idx * U32.size)
+            s = self._strings[idx] = str(self._buf[self._data_at + start:self._data_at + end], 'utf-8')
+        return s
+
+    def _record(self, pos):
+        return GUIDE.unpack_from(self._buf, self._guides_at + pos * GUIDE.size)
+
+    def _decode(self, rec):
+        entry = {field: self._string(ref) for field, ref in zip(GUIDE_FIELDS[1:], rec[1:7])}
+        first, count = rec[7], rec[8]
+        refs = struct.unpack_from(f'<{count}I', self._buf, self._refs_at + first * U32.size)
+        entry['keywords'] = [self._string(r) for r in refs]
+        return entry
+
+    def _find(self, guide_id):
+        lo, hi = 0, self._n_guides
+        while lo < hi:
+            mid = (lo + hi) // 2
+            rec = self._record(mid)
+            key = self._string(rec[0])
+            if key < guide_id:
+                lo = mid + 1
+            elif key > guide_id:
+                hi = mid
+            else:
+                return rec
+        return None
+
+    # ── Public API ──
+
+    @property
+    def generated_at(self):
+        return None if self._generated_ref == NO_STRING else self._string(self._generated_ref)
+
+    def __len__(self):
+        return self._n_guides
+
+    def __contains__(self, guide_id):
+        return self._find(guide_id) is not None
+
+    def __getitem__(self, guide_id):
+        rec = self._find(guide_id)
+        if rec is None:
+            raise KeyError(guide_id)
+        return self._decode(rec)
+
+    def get(self, guide_id, default=None):
+        rec = self._find(guide_id)
+        return default if rec is None else self._decode(rec)
+
+    def ids(self):
+        """Guide ids in catalog (CLASS_CATALOG) order."""
+        for i in range(self._n_guides):
+            (pos,) = U32.unpack_from(self._buf, self._order_at + i * U32.size)
+            yield self._string(self._record(pos)[0])
+
+    def items(self):
+        for i in range(self._n_guides):
+            (pos,) = U32.unpack_from(self._buf, self._order_at + i * U32.size)
+            rec = self._record(pos)
+            yield self._string(rec[0]), self._decode(rec)
+
+    def to_dict(self):
+        """Decode everything back into the catalog.json shape."""
+        return {'version': self.version, 'generated_at': self.generated_at, 'guides': dict(self.items())}
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Whole-site link index for the study guides.
+
+Parses every guides/*.html, guides/configs/*-config.js and
+guides/quiz/data/*-questions.js once, records the element ids each guide
+defines and every reference between them, and answers questions from the
+resulting graph:
+
+    link      <a href="copd.html">, <a href="copd.html#x"> or "#x" in a guide
+    quiz      a guide's quiz link (quiz/quiz.html?topic=X) -> that quiz bank
+    deep      a quiz question's guideSectionId -> an id in its guide
+    sidebar   a sidebar config section id -> an id in its guide
+    pearl     a sidebar config clinicalPearls tip id -> an id in its guide
+    keynum    a sidebar config quickRef section link -> an id in its guide
+
+Targets are written guide (the page), guide#id or quiz:guide.
+
+Usage:
+    python3 scripts/guide-links.py                        # broken references anywhere
+    python3 scripts/guide-links.py --refs asthma#medications
+    python3 scripts/guide-links.py --refs asthma          # anything pointing into the guide
+    python3 scripts/guide-links.py --format json
+
+The per-file facts and the derived graph are kept in
+.cache/guide-links.json (gitignored). A run only restats the inputs:
+files whose size and mtime (then content hash) are unchanged are not
+reparsed, and when nothing changed the stored graph answers directly,
+so a query is a dict lookup rather than a rescan of every file.
+--no-cache rebuilds from scratch. Exits 1 when any reference is broken
+(or, with --refs, when nothing references the target).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from js_literal import parse_var
+from sidebar_config import parse_config
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+GUIDES = REPO_ROOT / 'guides'
+SOURCES = ('guides/*.html', 'guides/configs/*-config.js', 'guides/quiz/data/*-questions.js')
+CACHE = REPO_ROOT / '.cache' / 'guide-links.json'
+CACHE_VERSION = 1
+BUILDER_SRC = (Path(__file__).resolve(),) + tuple(Path(__file__).resolve().parent / name
+                                                  for name in ('js_literal.py', 'sidebar_config.py'))
+EXTERNAL = re.compile(r'^(?:[a-z][a-z0-9+.-]*:|//)', re.I)
+
+
+# ── Per-file facts ───────────────────────────────────────────────
+# Each parser returns a small JSON-able dict; these are what the cache
+# stores, so a file is only ever parsed again when its content changes.
+
+def link_target(href, gid):
+    """Graph target for an <a href> in guides/<gid>.html, or None if it leaves the guides."""
+    if not href or EXTERNAL.match(href):
+        return None
+    url = urlsplit(href)
+    if not url.path:
+        return f'{gid}#{url.fragment}' if url.fragment else None
+    if url.path == 'quiz/quiz.html':
+        topic = parse_qs(url.query).get('topic')
+        return f'quiz:{topic[0]}' if topic else None
+    if '/' in url.path or not url.path.endswith('.html'):
+        return None
+    page = url.path[:-len('.html')]
+    return f'{page}#{url.fragment}' if url.fragment else page
+
+
+class LinkScanner(HTMLParser):
+    """Element ids and <a href> targets of one guide, in one forward pass."""
+
+    def __init__(self, gid):
+        super().__init__(convert_charrefs=True)
+        self.gid = gid
+        self.ids = set()
+        self.links = []  # [target, line]
+
+    def handle_starttag(self, tag, attrs):
+        href = None
+        for name, value in attrs:
+            if name == 'id' and value:
+                self.ids.add(value)
+            elif name == 'href':
+                href = value
+        if tag == 'a':
+            target = link_target(href, self.gid)
+            if target:
+                self.links.append([target, self.getpos()[0]])
+
+
+def html_facts(gid, text):
+    scanner = LinkScanner(gid)
+    scanner.feed(text)
+    scanner.close()
+    return {'ids': sorted(scanner.ids), 'links': scanner.links}
+
+
+def config_facts(gid, text):
+    config = parse_config(text)
+    if config.problems and not (config.sections or config.quick_ref or config.pearls):
+        raise RuntimeError(config.problems[0])
+    return {
+        'sections': [s.id for s in config.sections if s.id],
+        'pearls': [p.id for p in config.pearls if p.id],
+        'keynums': [q.section for q in config.quick_ref if q.section],
+    }
+
+
+def quiz_facts(gid, text):
+    _, data = parse_var(text, r'\w+QuizData')
+    return {'deep': [[q.get('id'), q['guideSectionId']] for q in data.get('questions') or []
+                     if isinstance(q, dict) and q.get('guideSectionId')]}
+
+
+def classify(rel):
+    """(kind, guide id, parser) for a source path relative to the repo."""
+    name = rel.rsplit('/', 1)[-1]
+    if rel.startswith('guides/configs/'):
+        return 'config', name[:-len('-config.js')], config_facts
+    if rel.startswith('guides/quiz/data/'):
+        return 'quiz', name[:-len('-questions.js')], quiz_facts
+    return 'html', name[:-len('.html')], html_facts
+
+
+# ── Graph ────────────────────────────────────────────────────────
+
+def build_graph(files):
+    """
+    Derive the reference graph from per-file facts:
+      refs    target -> [[kind, source], ...]; guide-level targets also
+              collect every reference to one of their ids
+      broken  [[kind, source, target], ...] whose target does not exist
+      errors  [source, message] for files that could not be parsed
+    """
+    ids, quizzes, edges, errors = {}, set(), [], []
+    for rel, entry in files.items():
+        kind, gid, _ = classify(rel)
+        facts = entry['facts']
+        if 'error' in facts:
+            errors.append([rel, facts['error']])
+            continue
+        if kind == 'html':
+            ids[gid] = set(facts['ids'])
+            for target, line in facts['links']:
+                edges.append(['quiz' if target.startswith('quiz:') else 'link', f'{rel}:{line}', target])
+        elif kind == 'config':
+            edges += [['sidebar', rel, f'{gid}#{sid}'] for sid in facts['sections']]
+            edges += [['pearl', rel, f'{gid}#{tid}'] for tid in facts['pearls']]
+            edges += [['keynum', rel, f'{gid}#{sid}'] for sid in facts['keynums']]
+        else:
+            quizzes.add(gid)
+            edges += [['deep', f'{rel} question {qid}', f'{gid}#{sid}'] for qid, sid in facts['deep']]
+
+    def exists(target):
+        if target.startswith('quiz:'):
+            return target[len('quiz:'):] in quizzes
+        page, _, frag = target.partition('#')
+        return page in ids and (not frag or frag in ids[page])
+
+    refs, broken = {}, []
+    for kind, source, target in edges:
+        refs.setdefault(target, []).append([kind, source])
+        if '#' in target:
+            refs.setdefault(target.partition('#')[0], []).append([kind, source])
+        if not exists(target):
+            broken.append([kind, source, target])
+    return {
+        'guides': len(ids),
+        'references': len(edges),
+        'refs': refs,
+        'broken': broken,
+        'errors': errors,
+    }
+
+
+# ── Index cache ──────────────────────────────────────────────────
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_cache(builder_hash):
+    try:
+        cache = json.loads(CACHE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != CACHE_VERSION or cache.get('builder') != builder_hash:
+        return {}
+    return cache
+
+
+def save_cache(cache):
+    try:
+        CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE.with_name(f'{CACHE.name}.{os.getpid()}.tmp')
+        tmp.write_text(json.dumps(cache, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp, CACHE)
+    except OSError as e:
+        print(f'WARNING: could not write link index {CACHE}: {e}', file=sys.stderr)
+
+
+def refresh_index(use_cache=True):
+    """Return (index, files reparsed), reparsing only changed inputs."""
+    builder_hash = sha256(b''.join(p.read_bytes() for p in BUILDER_SRC))
+    cache = load_cache(builder_hash) if use_cache else {}
+    old_files = cache.get('files', {})
+    files, reparsed = {}, 0
+    for pattern in SOURCES:
+        for path in sorted(REPO_ROOT.glob(pattern)):
+            rel = path.relative_to(REPO_ROOT).as_posix()
+            st = path.stat()
+            old = old_files.get(rel)
+            if old and old['mtime_ns'] == st.st_mtime_ns and old['size'] == st.st_size:
+                files[rel] = old
+                continue
+            raw = path.read_bytes()
+            digest = sha256(raw)
+            if old and old['sha256'] == digest:
+                files[rel] = dict(old, mtime_ns=st.st_mtime_ns, size=st.st_size)
+                continue
+            _, gid, parse = classify(rel)
+            try:
+                facts = parse(gid, raw.decode('utf-8'))
+            except (RuntimeError, UnicodeDecodeError) as e:
+                facts = {'error': str(e)}
+            files[rel] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'sha256': digest, 'facts': facts}
+            reparsed += 1
+
+    if files == old_files and 'graph' in cache:
+        return cache['graph'], 0
+    graph = build_graph(files)
+    if use_cache:
+        save_cache({'version': CACHE_VERSION, 'builder': builder_hash, 'files': files, 'graph': graph})
+    return graph, reparsed
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Whole-site link index for the study guides')
+    ap.add_argument('--refs', metavar='TARGET', help='list what references guide, guide#id or quiz:guide')
+    ap.add_argument('--format', choices=('text', 'json'), default='text')
+    ap.add_argument('--no-cache', action='store_true', help='reparse every file and do not write the index')
+    args = ap.parse_args()
+
+    graph, reparsed = refresh_index(use_cache=not args.no_cache)
+
+    if args.refs:
+        refs = graph['refs'].get(args.refs, [])
+        if args.format == 'json':
+            print(json.dumps({'target': args.refs, 'refs': refs}, indent=2))
+        else:
+            for kind, source in refs:
+                print(f'{kind:<8} {source}')
+            print(f'{len(refs)} reference(s) to {args.refs}')
+        sys.exit(0 if refs else 1)
+
+    if args.format == 'json':
+        print(json.dumps({key: graph[key] for key in ('guides', 'references', 'broken', 'errors')}, indent=2))
+    else:
+        for source, message in graph['errors']:
+            print(f'ERROR: {source}: {message}')
+        for kind, source, target in graph['broken']:
+            print(f'{kind:<8} {source} -> {target}')
+        mark = '✗' if graph['broken'] or graph['errors'] else '✓'
+        print(f"{mark} {graph['guides']} guides, {graph['references']} references, "
+              f"{len(graph['broken'])} broken ({reparsed} file(s) reparsed)")
+    if graph['broken'] or graph['errors']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+r"""
+Parser for the JS data literals the site keeps in plain script files.
+
+CLASS_CATALOG in my-guides-script.js, the quiz banks in
+guides/quiz/data/*-questions.js and the sidebar configs in
+guides/configs/*-config.js are JS object/array literals assigned to a
+global. LiteralParser turns one into Python values; parse_var finds the
+assignment first.
+
+    name, data = parse_var(src, r'\w+QuizData')
+"""
+
+import re
+
+# One compiled scanner drives a recursive-descent parser over the
+# literal. Every token is matched in place with
+# pattern.match(src, pos), so the whole literal is read in a single
+# forward pass without slicing the remaining source.
+TOKEN_RE = re.compile(r"""
+    (?P<ws>(?:\s+|//[^\n]*|/\*.*?\*/)+)
+  | (?P<str>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*")
+  | (?P<num>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<punct>[\[\]{}:,])
+""", re.X | re.S)
+
+ESCAPE_RE = re.compile(r'\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)', re.S)
+ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+KEYWORDS = {'true': True, 'false': False, 'null': None}
+
+
+def _unescape(m):
+    esc = m.group(1)
+    if esc[0] in 'ux' and len(esc) > 1:
+        return chr(int(esc[1:], 16))
+    return ESCAPES.get(esc, esc)
+
+
+def _string(token):
+    """The value of a quoted string token (string values and quoted keys alike)."""
+    body = token[1:-1]
+    return ESCAPE_RE.sub(_unescape, body) if '\\' in body else body
+
+
+class LiteralParser:
+    """
+    Parse a JS array/object literal (the subset the site's data files
+    use: strings, numbers, booleans, null, nested arrays/objects, bare
+    or quoted keys, trailing commas, comments) into Python values.
+    """
+
+    def __init__(self, src, pos=0):
+        self.src = src
+        self.pos = pos
+        self.kind = None
+        self.value = None
+        self._advance()
+
+    def _advance(self):
+        m = TOKEN_RE.match(self.src, self.pos)
+        if m and m.lastgroup == 'ws':
+            self.pos = m.end()
+            m = TOKEN_RE.match(self.src, self.pos)
+        self.start = self.pos
+        if m is None:
+            # Not an error yet: the literal may already be complete (the
+            # lookahead after the closing ']' lands on ';'). Callers raise
+            # if they actually need this token.
+            self.kind = 'eof' if self.pos >= len(self.src) else 'invalid'
+            self.value = self.src[self.pos:self.pos + 1] or None
+            return
+        self.kind = m.lastgroup
+        self.value = m.group()
+        self.pos = m.end()
+
+    def _expect(self, punct):
+        if self.kind != 'punct' or self.value != punct:
+            raise RuntimeError(f'Expected {punct!r} at offset {self.start}, found {self.value!r}')
+        self._advance()
+
+    def parse_value(self):
+        kind, value = self.kind, self.value
+        if kind == 'punct' and value == '[':
+            return self._parse_array()
+        if kind == 'punct' and value == '{':
+            return self._parse_object()
+        if kind == 'str':
+            self._advance()
+            return _string(value)
+        if kind == 'num':
+            self._advance()
+            return float(value) if any(c in value for c in '.eE') else int(value)
+        if kind == 'ident' and value in KEYWORDS:
+            self._advance()
+            return KEYWORDS[value]
+        if kind == 'eof':
+            raise RuntimeError('Unterminated JS literal')
+        if kind == 'invalid':
+            raise RuntimeError(f'Unexpected character {value!r} at offset {self.start}')
+        raise RuntimeError(f'Unsupported token {value!r} at offset {self.start}')
+
+    def _parse_array(self):
+        self._advance()  # '['
+        items = []
+        while not (self.kind == 'punct' and self.value == ']'):
+            items.append(self.parse_value())
+            if self.kind == 'punct' and self.value == ',':
+                self._advance()
+            elif not (self.kind == 'punct' and self.value == ']'):
+                raise RuntimeError(f"Expected ',' or ']' at offset {self.start}, found {self.value!r}")
+        self._advance()  # ']'
+        return items
+
+    def _parse_object(self):
+        self._advance()  # '{'
+        obj = {}
+        while not (self.kind == 'punct' and self.value == '}'):
+            if self.kind == 'ident':
+                key = self.value
+            elif self.kind == 'str':
+                key = _string(self.value)
+            else:
+                raise RuntimeError(f'Expected object key at offset {self.start}, found {self.value!r}')
+            self._advance()
+            self._expect(':')
+            obj[key] = self.parse_value()
+            if self.kind == 'punct' and self.value == ',':
+                self._advance()
+            elif not (self.kind == 'punct' and self.value == '}'):
+                raise RuntimeError(f"Expected ',' or '}}' at offset {self.start}, found {self.value!r}")
+        self._advance()  # '}'
+        return obj
+
+
+def parse_var(js_src, name=r'[A-Za-z_$][\w$]*'):
+    """
+    Parse the literal assigned by the first `var <name> = [` or `{`
+    (or let/const) whose name matches the regex name. Returns
+    (variable name, value).
+    """
+    m = re.search(r'\b(?:var|let|const)\s+(' + name + r')\s*=\s*(?=[\[{])', js_src)
+    if not m:
+        raise RuntimeError(f'Could not find var {name} in source')
+    return m.group(1), LiteralParser(js_src, m.end()).parse_value()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Site-wide sentence-length report for the study guides.
+
+Scans every guide once with verify-guide.py's GuideScanner (the same
+paragraph sentences its median/under8 checks use), loads the lengths into
+one sentence_metrics.SentenceTable and reports each guide's distribution
+against the readability targets (median <= 10 words, >= 28% under 8):
+
+    python3 scripts/sentence-report.py                 every guide + library totals
+    python3 scripts/sentence-report.py --sections      also sections outside the targets
+    python3 scripts/sentence-report.py asthma copd --sections   every section of these
+    python3 scripts/sentence-report.py --format json
+
+The table is computed in one vectorised pass when NumPy is installed and
+with the stdlib otherwise; the numbers are the same.
+"""
+
+import argparse
+import importlib.util
+import json
+from pathlib import Path
+
+from sentence_metrics import MAX_MEDIAN, MIN_SHORT, SHORT, SentenceTable, np
+
+HERE = Path(__file__).resolve().parent
+MIN_SECTION_SENTENCES = 5  # smaller sections are too noisy to flag
+
+
+def load_verifier():
+    """Import verify-guide.py (hyphenated) by path."""
+    spec = importlib.util.spec_from_file_location('verify_guide', HERE / 'verify-guide.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def row(name, dist, width):
+    return (f"{name:<{width}} {dist['sentences']:>9} {dist['median']:>7.1f} {dist['p75']:>6.1f} "
+            f"{dist['p90']:>6.1f} {dist[f'under{SHORT}']:>6}%  {'ok' if dist['ok'] else 'OUTSIDE'}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Site-wide sentence-length report for the study guides')
+    ap.add_argument('guides', nargs='*', help='guide ids (default: every guides/*.html)')
+    ap.add_argument('--sections', action='store_true',
+                    help='per-section rows: every section of the named guides, or those outside the targets')
+    ap.add_argument('--format', choices=('text', 'json'), default='text')
+    args = ap.parse_args()
+
+    vg = load_verifier()
+    ids = args.guides or vg.all_guides()
+    table = SentenceTable()
+    for gid in ids:
+        html = vg.scan_html(gid)
+        table.add(gid, html.sentence_lengths, html.sentence_sections, html.section_names)
+
+    guides = table.by_guide()
+    sections = table.by_section() if args.sections else {}
+    if not args.guides:
+        sections = {key: dist for key, dist in sections.items()
+                    if dist and not dist['ok'] and dist['sentences'] >= MIN_SECTION_SENTENCES}
+    overall = table.overall()
+
+    if args.format == 'json':
+        print(json.dumps({
+            'targets': {'max_median': MAX_MEDIAN, f'min_under{SHORT}': MIN_SHORT},
+            'guides': guides,
+            'sections': [dict(dist, guide=gid, section=sid) for (gid, sid), dist in sections.items() if dist],
+            'library': overall,
+        }, indent=2))
+        return
+
+    width = max([len(gid) for gid in ids] + [len('library')])
+    print(f"{'guide':<{width}} {'sentences':>9} {'median':>7} {'p75':>6} {'p90':>6} {f'<{SHORT}w':>7}")
+    for gid, dist in guides.items():
+        print(row(gid, dist, width) if dist else f'{gid:<{width}}         0  (no paragraph sentences)')
+    if overall:
+        print(row('library', overall, width))
+    if sections:
+        print('\nSections:' if args.guides else '\nSections outside the targets:')
+        for (gid, sid), dist in sections.items():
+            if dist:
+                print('  ' + row(f'{gid}#{sid or "(outside sections)"}', dist, width + 24))
+    outside = [gid for gid, dist in guides.items() if dist and not dist['ok']]
+    print(f'\n{len(outside)} of {len(guides)} guides outside the targets (median <= {MAX_MEDIAN}, '
+          f'>= {MIN_SHORT}% under {SHORT} words){"" if np is not None else "; NumPy not installed, stdlib path"}')
+
+
+if __name__ == '__main__':
+    main()
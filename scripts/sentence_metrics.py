@@ -0,0 +1,128 @@
+"""
+Sentence-length statistics for the study guides.
+
+verify-guide.py's GuideScanner splits each guide's document-content
+paragraphs into sentences while it scans and keeps only their word
+counts, in compact arrays: array('H') of lengths (two bytes a sentence)
+and the index of the <section> each sentence ends in. This module turns
+those into distributions:
+
+    distribution(lengths)   sentences, median, p25/p75/p90 and the share
+                            under 8 words, for one guide or section
+    SentenceTable           many guides' sentences in flat arrays, with a
+                            guide and a section group per sentence;
+                            by_guide() / by_section() compute every
+                            group's distribution and the readability
+                            thresholds in one pass
+
+NumPy is optional. With it the table pass is vectorised (one lexsort and
+a few reductions over every sentence in the library); without it the
+same numbers come from a loop over the stdlib arrays.
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # optional: the stdlib path gives the same numbers
+    np = None
+
+# Readability targets from GUIDE_REBUILD_PLAN.md (see verify-guide.py)
+SHORT = 8          # words; a sentence under this counts as short
+MAX_MEDIAN = 10    # a guide's median sentence may be at most this long
+MIN_SHORT = 28     # and at least this percentage must be short
+PERCENTILES = (25, 50, 75, 90)
+
+
+def percentile(ordered, q):
+    """Linear-interpolated percentile of an already sorted sequence (q=50 is the median)."""
+    pos = (len(ordered) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return float(ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo))
+
+
+def short_share(lengths, short=SHORT):
+    """Whole percentage of sentences under short words."""
+    return 100 * sum(1 for n in lengths if n < short) // len(lengths)
+
+
+def readable(median, short_pct):
+    return median <= MAX_MEDIAN and short_pct >= MIN_SHORT
+
+
+def distribution(lengths, short=SHORT):
+    """Distribution of one group's sentence lengths, or None when it has none."""
+    if not len(lengths):
+        return None
+    ordered = sorted(lengths)
+    p25, median, p75, p90 = (percentile(ordered, q) for q in PERCENTILES)
+    pct = short_share(lengths, short)
+    return {'sentences': len(lengths), 'median': median, 'p25': p25, 'p75': p75, 'p90': p90,
+            f'under{short}': pct, 'ok': readable(median, pct)}
+
+
+def _group_stats_numpy(lengths, groups, count, short):
+    lengths = np.frombuffer(lengths, dtype=np.uint16)
+    groups = np.frombuffer(groups, dtype=np.uint32)
+    sizes = np.bincount(groups, minlength=count)
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    ordered = lengths[np.lexsort((lengths, groups))].astype(np.float64)
+    filled = sizes > 0
+    last = np.maximum(sizes - 1, 0)
+
+    def pct(q):
+        pos = last * q / 100
+        lo = np.floor(pos).astype(np.int64)
+        hi = np.minimum(lo + 1, last)
+        lo_v = ordered[np.where(filled, starts + lo, 0)]
+        hi_v = ordered[np.where(filled, starts + hi, 0)]
+        return lo_v + (hi_v - lo_v) * (pos - lo)
+
+    p25, median, p75, p90 = (pct(q) for q in PERCENTILES)
+    shorts = np.bincount(groups, weights=lengths < short, minlength=count).astype(np.int64)
+    share = 100 * shorts // np.maximum(sizes, 1)
+    ok = (median <= MAX_MEDIAN) & (share >= MIN_SHORT)
+    return [None if not filled[i] else
+            {'sentences': int(sizes[i]), 'median': float(median[i]), 'p25': float(p25[i]),
+             'p75': float(p75[i]), 'p90': float(p90[i]), f'under{short}': int(share[i]), 'ok': bool(ok[i])}
+            for i in range(count)]
+
+
+def group_stats(lengths, groups, count, short=SHORT):
+    """distribution() of each of count groups; groups[i] is the group of lengths[i]."""
+    if np is not None and len(lengths):
+        return _group_stats_numpy(lengths, groups, count, short)
+    buckets = [array('H') for _ in range(count)]
+    for n, g in zip(lengths, groups):
+        buckets[g].append(n)
+    return [distribution(bucket, short) for bucket in buckets]
+
+
+class SentenceTable:
+    """Sentence lengths of many guides in flat arrays, grouped by guide and by section."""
+
+    def __init__(self):
+        self.lengths = array('H')
+        self.guide = array('I')    # group index into self.guides, per sentence
+        self.section = array('I')  # group index into self.sections, per sentence
+        self.guides = []           # guide ids
+        self.sections = []         # (guide id, section id) pairs; '' outside any section
+
+    def add(self, gid, lengths, sections, section_names):
+        """Add one guide: its sentence lengths, each one's section index, and the section ids."""
+        g, base = len(self.guides), len(self.sections)
+        self.guides.append(gid)
+        self.sections += [(gid, name) for name in section_names]
+        self.lengths.extend(lengths)
+        self.guide.extend([g] * len(lengths))
+        self.section.extend(base + s for s in sections)
+
+    def by_guide(self, short=SHORT):
+        return dict(zip(self.guides, group_stats(self.lengths, self.guide, len(self.guides), short)))
+
+    def by_section(self, short=SHORT):
+        return dict(zip(self.sections, group_stats(self.lengths, self.section, len(self.sections), short)))
+
+    def overall(self, short=SHORT):
+        return distribution(self.lengths, short)
@@ -0,0 +1,228 @@
+"""
+Structured reader and validator for guides/configs/<guide>-config.js.
+
+Each config assigns `const sidebarConfig = {...}`, which guide-sidebar.js
+renders:
+
+    sections        [{id, icon, title}]                   table of contents
+    quickRef        [{type, icon, value, label, section}]  key numbers; section
+                                                          (optional) links one to
+                                                          where it is explained
+    clinicalPearls  [{id, title, text}]                   jump links to the
+                                                          FlorenceBot tips; id
+                                                          defaults to one derived
+                                                          from the title
+
+parse_config() turns the literal into SidebarConfig named tuples plus a
+list of structural problems; validate() compares one against the ids a
+guide's HTML defines.
+
+Parses are memoized by content hash. load_configs() reads many configs at
+once and keeps the parses in <root>/.cache/sidebar-configs.json
+(gitignored), so a bulk run only parses the configs whose content
+changed. read_config() given the same root loads that table on its first
+miss, so pool workers that start empty (spawn) reuse it too.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from js_literal import parse_var
+
+CACHE_NAME = Path('.cache', 'sidebar-configs.json')  # under the checkout's root
+CACHE_VERSION = 1
+PARSER_SRC = (Path(__file__).resolve(), Path(__file__).resolve().parent / 'js_literal.py')
+
+# .key-number variants styled in guide-sidebar.css
+QUICKREF_TYPES = {'critical', 'time', 'warning', 'target', 'success', 'info'}
+
+
+class Section(NamedTuple):
+    id: str
+    icon: str
+    title: str
+
+
+class QuickRef(NamedTuple):
+    type: str
+    icon: str
+    value: str
+    label: str
+    section: Optional[str]
+
+
+class Pearl(NamedTuple):
+    id: str
+    title: str
+    text: str
+
+
+class SidebarConfig(NamedTuple):
+    sections: tuple
+    quick_ref: tuple
+    pearls: tuple
+    problems: tuple  # structural problems found while parsing, as messages
+
+
+def tip_id(title):
+    """The id guide-sidebar.js gives a pearl without one."""
+    return 'tip-' + re.sub(r'-+$', '', re.sub(r'[^a-z0-9]+', '-', title.lower()))
+
+
+def parse_config(text):
+    """Parse one config's source into a SidebarConfig."""
+    problems = []
+    try:
+        _, raw = parse_var(text, 'sidebarConfig')
+    except RuntimeError as e:
+        return SidebarConfig((), (), (), (str(e),))
+    if not isinstance(raw, dict):
+        return SidebarConfig((), (), (), ('sidebarConfig is not an object',))
+
+    def entries(key):
+        value = raw.get(key, [])
+        if not isinstance(value, list):
+            problems.append(f'{key} is not an array')
+            return []
+        out = []
+        for n, entry in enumerate(value, 1):
+            if isinstance(entry, dict):
+                out.append((n, entry))
+            else:
+                problems.append(f'{key} #{n} is not an object')
+        return out
+
+    def text_field(entry, key, where, required=True):
+        value = entry.get(key)
+        if isinstance(value, str) and value.strip():
+            return value
+        if required or value is not None:
+            problems.append(f'{where}: missing {key}')
+        return None
+
+    sections = []
+    for n, e in entries('sections'):
+        where = f'sections #{n}'
+        sections.append(Section(text_field(e, 'id', where), text_field(e, 'icon', where),
+                                text_field(e, 'title', where)))
+    quick_ref = []
+    for n, e in entries('quickRef'):
+        where = f'quickRef #{n}'
+        item = QuickRef(text_field(e, 'type', where), text_field(e, 'icon', where), text_field(e, 'value', where),
+                        text_field(e, 'label', where), text_field(e, 'section', where, required=False))
+        if item.type and item.type not in QUICKREF_TYPES:
+            problems.append(f'{where}: unknown type {item.type!r}')
+        quick_ref.append(item)
+    pearls = []
+    for n, e in entries('clinicalPearls'):
+        where = f'clinicalPearls #{n}'
+        title = text_field(e, 'title', where)
+        pid = text_field(e, 'id', where, required=False) or (tip_id(title) if title else None)
+        if pid and not pid.startswith('tip-'):
+            problems.append(f'{where}: id {pid!r} does not start with tip-')
+        pearls.append(Pearl(pid, title, text_field(e, 'text', where)))
+
+    for name, items in (('section', sections), ('pearl', pearls)):
+        ids = [item.id for item in items if item.id]
+        for dup in sorted({i for i in ids if ids.count(i) > 1}):
+            problems.append(f'duplicate {name} id {dup!r}')
+    return SidebarConfig(tuple(sections), tuple(quick_ref), tuple(pearls), tuple(problems))
+
+
+def validate(config, ids, sections, tips):
+    """
+    Compare a config with its guide: ids is every element id in the HTML,
+    sections the <section> ids and tips the FlorenceBot tip ids. Returns
+    sorted lists of the ids out of sync.
+    """
+    cfg_sections = {s.id for s in config.sections if s.id}
+    cfg_tips = {p.id for p in config.pearls if p.id}
+    links = {q.section for q in config.quick_ref if q.section}
+    return {
+        'tips_only_cfg': sorted(cfg_tips - tips),
+        'tips_only_html': sorted(tips - cfg_tips),
+        'sec_only_cfg': sorted(cfg_sections - sections),
+        'quickref_missing': sorted(links - ids),
+    }
+
+
+# ── Memo and bulk cache ──────────────────────────────────────────
+
+_parsed = {}   # sha256 of the source -> SidebarConfig
+_loaded = {}   # cache file -> its configs table, once read into _parsed
+
+
+def _lookup(path, root=None):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    key = hashlib.sha256(raw).hexdigest()
+    config = _parsed.get(key)
+    if config is None and root is not None:
+        _load_cache(Path(root) / CACHE_NAME)
+        config = _parsed.get(key)
+    if config is None:
+        config = _parsed[key] = parse_config(raw.decode('utf-8'))
+    return key, config
+
+
+def read_config(path, root=None):
+    """
+    Parse the config at path, reusing an earlier parse of the same content;
+    with root, the parses load_configs() stored for that checkout as well.
+    """
+    return _lookup(path, root)[1]
+
+
+def _from_json(entry):
+    sections, quick_ref, pearls, problems = entry
+    return SidebarConfig(tuple(Section(*s) for s in sections), tuple(QuickRef(*q) for q in quick_ref),
+                         tuple(Pearl(*p) for p in pearls), tuple(problems))
+
+
+def _parser_hash():
+    return hashlib.sha256(b''.join(p.read_bytes() for p in PARSER_SRC)).hexdigest()
+
+
+def _load_cache(cache):
+    """Read a stored table (once per process) into the memo; returns it."""
+    if cache not in _loaded:
+        try:
+            data = json.loads(cache.read_text(encoding='utf-8'))
+            if data.get('version') != CACHE_VERSION or data.get('parser') != _parser_hash():
+                data = {}
+        except (OSError, ValueError):
+            data = {}
+        _loaded[cache] = data.get('configs', {})
+        for key, entry in _loaded[cache].items():
+            _parsed.setdefault(key, _from_json(entry))
+    return _loaded[cache]
+
+
+def load_configs(paths, root):
+    """
+    Read every config in paths (parsing only new content), keeping the
+    parses in root's .cache; returns {path: SidebarConfig}.
+    """
+    cache = Path(root) / CACHE_NAME
+    stored = _load_cache(cache)
+
+    configs, used = {}, set()
+    for path in paths:
+        key, configs[path] = _lookup(path)
+        used.add(key)
+    if used != stored.keys():
+        table = {key: _parsed[key] for key in sorted(used)}
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache.with_name(f'{cache.name}.{os.getpid()}.tmp')
+            tmp.write_text(json.dumps({'version': CACHE_VERSION, 'parser': _parser_hash(), 'configs': table}),
+                           encoding='utf-8')
+            os.replace(tmp, cache)
+            _loaded[cache] = table
+        except OSError:
+            pass  # the parses still work, they just are not persisted
+    return configs
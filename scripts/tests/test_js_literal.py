@@ -0,0 +1,125 @@
+"""Tests for the JS literal parser and the compact catalog built from its output."""
+
+import pytest
+
+from compact_catalog import CompactCatalog, encode_catalog
+from js_literal import LiteralParser, parse_var
+
+
+def parse(src):
+    return LiteralParser(src).parse_value()
+
+
+# ── js_literal ───────────────────────────────────────────────────
+
+@pytest.mark.parametrize('src, expected', [
+    (r"'it\'s'", "it's"),
+    (r'"say \"hi\""', 'say "hi"'),
+    (r"'a\nb\tc'", 'a\nb\tc'),
+    (r"'back\\slash'", 'back\\slash'),
+    (r"'é \x41'", 'é A'),
+    (r"'\/path'", '/path'),
+    ("'no escapes'", 'no escapes'),
+])
+def test_string_escapes(src, expected):
+    assert parse(src) == expected
+
+
+def test_scalars():
+    assert parse('[1, -2, 3.5, 1e3, true, false, null]') == [1, -2, 3.5, 1000.0, True, False, None]
+
+
+def test_comments_are_skipped():
+    src = """{
+        // line comment
+        a: 1, /* block
+        comment */ b: [2 /* inline */, 3],
+    }"""
+    assert parse(src) == {'a': 1, 'b': [2, 3]}
+
+
+def test_trailing_commas():
+    assert parse('[1, 2, ]') == [1, 2]
+    assert parse('{a: {b: 1,}, c: [],}') == {'a': {'b': 1}, 'c': []}
+
+
+def test_quoted_and_bare_keys():
+    assert parse("""{bare: 1, 'single': 2, "double": 3, $dollar_1: 4}""") == {
+        'bare': 1, 'single': 2, 'double': 3, '$dollar_1': 4}
+    assert parse(r"""{'a\'b': 1, "c\u00e9": 2}""") == {"a'b": 1, 'c\u00e9': 2}
+
+
+@pytest.mark.parametrize('src, message', [
+    ('{a: ', 'Unterminated JS literal'),
+    ('[1, 2', "Expected ',' or ']'"),
+    ('[1 2]', "Expected ',' or ']'"),
+    ('{a 1}', "Expected ':'"),
+    ('{1: 2}', 'Expected object key'),
+    ('[undefined]', 'Unsupported token'),
+    ('[#]', 'Unexpected character'),
+])
+def test_malformed_literals(src, message):
+    with pytest.raises(RuntimeError, match=message):
+        parse(src)
+
+
+def test_parse_var_finds_the_named_assignment():
+    src = """
+    // const notThis = {x: 1};
+    var other = [0];
+    const asthmaQuizData = {guideSlug: 'asthma', questions: [{id: 1},]};
+    """
+    assert parse_var(src, r'\w+QuizData') == ('asthmaQuizData', {'guideSlug': 'asthma', 'questions': [{'id': 1}]})
+    assert parse_var(src) == ('notThis', {'x': 1})
+
+
+def test_parse_var_missing():
+    with pytest.raises(RuntimeError, match='Could not find var sidebarConfig'):
+        parse_var('var x = 1;', 'sidebarConfig')
+
+
+# ── compact_catalog ──────────────────────────────────────────────
+
+def guide(title, cls, keywords, population='Adult'):
+    return {'title': title, 'class': cls, 'class_name': cls.title(), 'category': 'cardio',
+            'category_name': 'Cardiovascular', 'population': population, 'keywords': keywords}
+
+
+CATALOG = {
+    'version': 2,
+    'generated_at': '2026-10-01T00:00:00Z',
+    'guides': {
+        # Not in id order, so the round trip has to keep catalog order
+        'heart-failure': guide('Heart Failure', 'med-surg', ['hf', 'bnp', 'digoxin']),
+        'asthma': guide('Asthma', 'med-surg', ['peak flow', 'hf']),
+        'neonatal-jaundice': guide('Neonatal Jaundice — Bilirubin', 'peds', [], population='Neonate'),
+    },
+}
+
+
+def test_compact_catalog_round_trip():
+    cat = CompactCatalog(encode_catalog(CATALOG))
+    assert cat.to_dict() == CATALOG
+    assert list(cat.ids()) == list(CATALOG['guides'])
+    assert len(cat) == 3
+
+
+def test_compact_catalog_lookups():
+    cat = CompactCatalog(encode_catalog(CATALOG))
+    assert cat['asthma'] == CATALOG['guides']['asthma']
+    assert 'copd' not in cat
+    assert cat.get('copd') is None
+    with pytest.raises(KeyError):
+        cat['copd']
+
+
+def test_compact_catalog_without_generated_at():
+    catalog = {'version': 1, 'guides': {'asthma': CATALOG['guides']['asthma']}}
+    cat = CompactCatalog(encode_catalog(catalog))
+    assert cat.generated_at is None
+    assert cat.to_dict() == dict(catalog, generated_at=None)
+
+
+def test_compact_catalog_rejects_other_data():
+    with pytest.raises(ValueError, match='bad magic'):
+        CompactCatalog(b'JUNK' + bytes(32))
@@ -0,0 +1,94 @@
+"""Tests for sidebar_config.parse_config, the problems it reports and the parse cache."""
+
+import pytest
+
+import sidebar_config
+from sidebar_config import Pearl, QuickRef, Section, parse_config, tip_id
+
+GOOD = """
+const sidebarConfig = {
+    sections: [
+        { id: 'overview', icon: 'fa-book', title: 'Overview' },
+        { id: 'nursing-care', icon: 'fa-heart', title: 'Nursing Care' },
+    ],
+    quickRef: [
+        { type: 'critical', icon: 'fa-bolt', value: '< 90', label: 'SpO2 %', section: 'overview' },
+        { type: 'info', icon: 'fa-clock', value: '2 h', label: 'Reassess' },
+    ],
+    clinicalPearls: [
+        { title: 'Watch the K+!', text: 'Check potassium before digoxin.' },
+        { id: 'tip-custom', title: 'Custom', text: 'Has its own id.' },
+    ],
+};
+"""
+
+
+def test_well_formed_config():
+    config = parse_config(GOOD)
+    assert config.problems == ()
+    assert config.sections == (Section('overview', 'fa-book', 'Overview'),
+                               Section('nursing-care', 'fa-heart', 'Nursing Care'))
+    assert config.quick_ref == (QuickRef('critical', 'fa-bolt', '< 90', 'SpO2 %', 'overview'),
+                                QuickRef('info', 'fa-clock', '2 h', 'Reassess', None))
+    assert config.pearls == (Pearl('tip-watch-the-k', 'Watch the K+!', 'Check potassium before digoxin.'),
+                             Pearl('tip-custom', 'Custom', 'Has its own id.'))
+
+
+def test_tip_id_matches_guide_sidebar():
+    assert tip_id('Watch the K+!') == 'tip-watch-the-k'
+    assert tip_id('  Two  words ') == 'tip--two-words'
+
+
+def test_missing_lists_are_empty():
+    config = parse_config('const sidebarConfig = {};')
+    assert (config.sections, config.quick_ref, config.pearls, config.problems) == ((), (), (), ())
+
+
+@pytest.mark.parametrize('src, problem', [
+    ('var somethingElse = {};', 'Could not find var sidebarConfig in source'),
+    ('const sidebarConfig = {sections: [};', "Unsupported token '}' at offset 34"),
+    ('const sidebarConfig = [];', 'sidebarConfig is not an object'),
+    ("const sidebarConfig = {sections: {id: 'a'}};", 'sections is not an array'),
+    ("const sidebarConfig = {quickRef: ['x']};", 'quickRef #1 is not an object'),
+    ("const sidebarConfig = {sections: [{id: 'a', icon: 'fa-a'}]};", 'sections #1: missing title'),
+    ("const sidebarConfig = {sections: [{id: ' ', icon: 'fa-a', title: 'A'}]};", 'sections #1: missing id'),
+    ("const sidebarConfig = {quickRef: [{type: 'info', icon: 'i', value: 'v', label: 'l', section: ''}]};",
+     'quickRef #1: missing section'),
+    ("const sidebarConfig = {quickRef: [{type: 'loud', icon: 'i', value: 'v', label: 'l'}]};",
+     "quickRef #1: unknown type 'loud'"),
+    ("const sidebarConfig = {clinicalPearls: [{id: 'pearl-1', title: 'T', text: 'x'}]};",
+     "clinicalPearls #1: id 'pearl-1' does not start with tip-"),
+    ("const sidebarConfig = {clinicalPearls: [{text: 'x'}]};", 'clinicalPearls #1: missing title'),
+    ("const sidebarConfig = {sections: [{id: 'a', icon: 'i', title: 'A'}, {id: 'a', icon: 'i', title: 'B'}]};",
+     "duplicate section id 'a'"),
+    ("const sidebarConfig = {clinicalPearls: [{title: 'Same', text: 'x'}, {id: 'tip-same', title: 'T', text: 'y'}]};",
+     "duplicate pearl id 'tip-same'"),
+])
+def test_problems(src, problem):
+    assert parse_config(src).problems == (problem,)
+
+
+def test_bad_entries_are_skipped_not_fatal():
+    config = parse_config("""const sidebarConfig = {
+        sections: [42, {id: 'ok', icon: 'i', title: 'OK'}],
+        quickRef: 'none',
+    };""")
+    assert config.sections == (Section('ok', 'i', 'OK'),)
+    assert config.quick_ref == ()
+    assert config.problems == ('sections #1 is not an object', 'quickRef is not an array')
+
+
+def test_stored_parses_are_read_back_under_the_given_root(tmp_path, monkeypatch):
+    path = tmp_path / 'guides' / 'configs' / 'x-config.js'
+    path.parent.mkdir(parents=True)
+    path.write_text(GOOD, encoding='utf-8')
+    monkeypatch.setattr(sidebar_config, '_parsed', {})
+    monkeypatch.setattr(sidebar_config, '_loaded', {})
+    config = sidebar_config.load_configs([path], tmp_path)[path]
+    assert (tmp_path / '.cache' / 'sidebar-configs.json').exists()
+
+    # a spawned pool worker: nothing in memory, and it must not parse again
+    monkeypatch.setattr(sidebar_config, '_parsed', {})
+    monkeypatch.setattr(sidebar_config, '_loaded', {})
+    monkeypatch.setattr(sidebar_config, 'parse_config', lambda text: pytest.fail('parsed again'))
+    assert sidebar_config.read_config(path, tmp_path) == config
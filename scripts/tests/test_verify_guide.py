@@ -0,0 +1,36 @@
+"""Tests for verify-guide.py's GuideScanner."""
+
+import importlib.util
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parent.parent
+
+spec = importlib.util.spec_from_file_location('verify_guide', SCRIPTS / 'verify-guide.py')
+vg = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(vg)
+
+
+def scan(html):
+    return vg.GuideScanner().scan(html)
+
+
+def test_unterminated_tag_with_unbalanced_quote():
+    # A '<' that never closes, followed by a lone quote, used to backtrack
+    # exponentially in the number of attribute-like words (n=14 took a minute)
+    html = ('<div class="document-content"><p>K <a' + ' x' * 200 + ' "unterminated.</p>'
+            '<section class="s" id="later"><p>One two three four.</p></section></div>')
+    h = scan(html)
+    assert h.div == [1, 1]
+    assert h.section == [1, 1]
+    assert h.sections == {'later'}
+    assert list(h.sentence_lengths) == [203, 4]
+
+
+def test_prose_less_than_sign_in_a_guide():
+    path = SCRIPTS.parent / 'guides' / 'asthma.html'
+    html = path.read_text(encoding='utf-8')
+    line = '<p>Hold the dose if K<Na ratio drops or the patient says "stop</p>\n'
+    at = html.index('</section>')
+    h, ref = scan(html[:at] + line + html[at:]), scan(html)
+    assert (h.div, h.section, h.sections, h.tips) == (ref.div, ref.section, ref.sections, ref.tips)
+    assert len(h.sentence_lengths) >= len(ref.sentence_lengths)
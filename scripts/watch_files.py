@@ -0,0 +1,42 @@
+"""
+Polling file watcher for the scripts' --watch modes.
+
+Stats the watched files every interval and yields the set of paths whose
+mtime or size changed, or that appeared or disappeared, since the last
+poll. Polling a few hundred files costs well under a millisecond, works
+the same on every platform and needs no inotify/fsevents dependency.
+
+    for changed in watch(lambda: [path_a, path_b]):
+        rebuild(changed)
+
+The path list is re-evaluated on every poll, so a glob picks up new files.
+"""
+
+import os
+import time
+
+INTERVAL = 0.1
+
+
+def snapshot(paths):
+    """path -> (mtime_ns, size) for the paths that exist."""
+    out = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        out[path] = (st.st_mtime_ns, st.st_size)
+    return out
+
+
+def watch(list_paths, interval=INTERVAL):
+    """Yield the set of changed paths after each poll that found any, forever."""
+    before = snapshot(list_paths())
+    while True:
+        time.sleep(interval)
+        after = snapshot(list_paths())
+        changed = {p for p in before.keys() | after.keys() if before.get(p) != after.get(p)}
+        before = after
+        if changed:
+            yield changed